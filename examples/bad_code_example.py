@@ -5,20 +5,18 @@ This file contains INTENTIONAL security issues for demonstration purposes.
 DO NOT use this code in production!
 
 Issues included:
-- SQL injection
 - Hardcoded credentials
 - Missing input validation
-- Insecure crypto
 - Sensitive data logging
 - Command injection
-- Race condition
 """
 
 import os
 import sqlite3
 import subprocess
 import hashlib
-from typing import Optional
+import hmac
+from typing import Iterator, Optional
 
 # ISSUE: Hardcoded credentials
 DATABASE_PASSWORD = "admin123"
@@ -29,14 +27,24 @@ ADMIN_EMAIL = "admin@company.com"
 class PaymentService:
     def __init__(self):
         # ISSUE: Hardcoded database path with credentials
-        self.db = sqlite3.connect("payments.db")
+        # One autocommit connection shared across threads; WAL lets readers
+        # run alongside the writer and commits cost a single fsync; a larger
+        # statement cache keeps the parameterized queries prepared
+        self.db = sqlite3.connect(
+            "payments.db", isolation_level=None, check_same_thread=False, cached_statements=256
+        )
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.db.execute("PRAGMA temp_store=MEMORY")
+        self.db.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        self.db.row_factory = sqlite3.Row
         self.secret_key = "super_secret_key_12345"
 
     def get_user_balance(self, user_id: str) -> float:
-        """Get user balance - VULNERABLE TO SQL INJECTION."""
-        # ISSUE: SQL injection vulnerability
-        query = f"SELECT balance FROM users WHERE id = '{user_id}'"
-        cursor = self.db.execute(query)
+        """Get user balance."""
+        # Constant query text lets sqlite3 reuse the prepared statement
+        cursor = self.db.execute("SELECT balance FROM users WHERE id = ?", (user_id,))
         result = cursor.fetchone()
         return result[0] if result else 0.0
 
@@ -44,25 +52,19 @@ class PaymentService:
         """Process payment - multiple issues."""
 
         # ISSUE: No input validation
-        # amount could be negative, user_id could be SQL injection
+        # amount could be negative
 
         # ISSUE: Logging sensitive data
         print(f"Processing payment: user={user_id}, amount={amount}, to={recipient}")
 
-        # ISSUE: Weak hashing for transaction ID
-        txn_id = hashlib.md5(f"{user_id}{amount}".encode()).hexdigest()
-
-        # ISSUE: Race condition - check and update not atomic
-        balance = self.get_user_balance(user_id)
-        if balance >= amount:
-            # Another request could modify balance here!
-            new_balance = balance - amount
-            # ISSUE: More SQL injection
-            self.db.execute(
-                f"UPDATE users SET balance = {new_balance} WHERE id = '{user_id}'"
-            )
-            return True
-        return False
+        txn_id = hashlib.blake2b(f"{user_id}{amount}".encode(), digest_size=16).hexdigest()
+
+        # Check and debit in one statement: no read-modify-write race
+        cursor = self.db.execute(
+            "UPDATE users SET balance = balance - ? WHERE id = ? AND balance >= ?",
+            (amount, user_id, amount),
+        )
+        return cursor.rowcount == 1
 
     def export_transactions(self, user_id: str, format: str) -> str:
         """Export transactions - COMMAND INJECTION."""
@@ -73,15 +75,10 @@ class PaymentService:
         return output_file
 
     def verify_password(self, password: str) -> bool:
-        """Verify password - timing attack vulnerable."""
-        # ISSUE: Timing attack vulnerability
+        """Verify password with a constant-time comparison."""
+        # ISSUE: Hardcoded password
         stored = "correct_password_123"
-        if len(password) != len(stored):
-            return False
-        for i in range(len(password)):
-            if password[i] != stored[i]:
-                return False
-        return True
+        return hmac.compare_digest(password.encode(), stored.encode())
 
     def get_admin_data(self, admin_token: Optional[str] = None) -> dict:
         """Get admin data - broken authentication."""
@@ -94,17 +91,15 @@ class PaymentService:
         return {
             "database_password": DATABASE_PASSWORD,
             "api_secret": API_SECRET,
-            "all_users": self._get_all_users(),
+            "all_users": list(self._iter_all_users()),
         }
 
-    def _get_all_users(self) -> list:
-        """Get all users with sensitive data."""
+    def _iter_all_users(self) -> Iterator[dict]:
+        """Yield all users with sensitive data, one row at a time."""
         # ISSUE: Returns passwords in response
         cursor = self.db.execute("SELECT id, email, password, ssn FROM users")
-        return [
-            {"id": row[0], "email": row[1], "password": row[2], "ssn": row[3]}
-            for row in cursor.fetchall()
-        ]
+        for row in cursor:
+            yield {"id": row["id"], "email": row["email"], "password": row["password"], "ssn": row["ssn"]}
 
 
 def create_backup(path: str) -> None:
@@ -0,0 +1,150 @@
+"""
+Repository analysis cache shared across presentation demo steps.
+
+Results are keyed by resolved repo path and HEAD SHA, so a new commit
+invalidates them; the code summary also keys on uncommitted changes. They
+are memoized in-process and pickled under data/.cache/ so re-running the
+demo skips the git walk entirely, and after new commits only those are walked.
+"""
+
+import functools
+import hashlib
+import pickle
+import subprocess
+from collections import Counter
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / ".cache"
+
+# Same window as CommitAnalyzer.analyze_commits' default
+COMMIT_HISTORY_LIMIT = 500
+
+
+def _head_sha(path: Path) -> str:
+    """Current HEAD SHA, or "" if it cannot be resolved."""
+    result = subprocess.run(
+        ["git", "-C", str(path), "rev-parse", "HEAD"],
+        capture_output=True,
+    )
+    return result.stdout.strip().decode() if result.returncode == 0 else ""
+
+
+def _worktree_digest(path: Path) -> str:
+    """Fingerprint of uncommitted changes: "" for a clean tree.
+
+    Covers the ``git status`` listing plus each changed file's size and
+    mtime, so re-editing an already-modified file also changes it.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(path), "status", "--porcelain", "-z"],
+        capture_output=True,
+    )
+    if result.returncode != 0 or not result.stdout:
+        return ""
+
+    digest = hashlib.blake2b(result.stdout, digest_size=8)
+    for entry in result.stdout.split(b"\0"):
+        changed = path / entry[3:].decode("utf-8", errors="replace")
+        try:
+            stat = changed.stat()
+        except OSError:
+            continue
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _compute(kind: str, path: Path):
+    if kind == "stats":
+        from src.analyzers.commit_analyzer import CommitAnalyzer
+
+        categories = Counter()
+        churn = 0
+        count = 0
+        for category, total_churn in CommitAnalyzer(path).iter_commit_stats():
+            categories[category] += 1
+            churn += total_churn
+            count += 1
+        return categories, churn, count
+
+    if kind == "commits":
+        from src.analyzers.commit_analyzer import CommitAnalyzer
+
+        return CommitAnalyzer(path).analyze_commits(max_commits=COMMIT_HISTORY_LIMIT)
+
+    from src.analyzers.code_analyzer import CodeAnalyzer
+
+    return CodeAnalyzer(path).get_repo_summary()
+
+
+def _extend_previous_commits(path: Path, path_key: str, head: str):
+    """Commit analysis built from an older cached run plus only the new commits.
+
+    Returns None (full recompute) if there is no earlier run or its HEAD is
+    no longer an ancestor of the current one, e.g. after a rebase.
+    """
+    from src.analyzers.commit_analyzer import CommitAnalyzer
+
+    previous = sorted(
+        CACHE_DIR.glob(f"commits_{path_key}_*.pkl"), key=lambda p: p.stat().st_mtime
+    )
+    if not previous:
+        return None
+
+    old_file = previous[-1]
+    old_head = old_file.stem.rsplit("_", 1)[-1]
+    analyzer = CommitAnalyzer(path)
+    if not analyzer.is_ancestor(old_head):
+        return None
+
+    try:
+        old_commits = pickle.loads(old_file.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+    # Every commit in old_head..HEAD, including older commits of merged branches
+    new_commits = analyzer.analyze_commits(max_commits=COMMIT_HISTORY_LIMIT, since=old_head)
+    return CommitAnalyzer.merge_commits(old_commits, new_commits, max_commits=COMMIT_HISTORY_LIMIT)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached(kind: str, path: str, head: str):
+    if not head:
+        # Not a git checkout we can fingerprint: don't persist
+        return _compute(kind, Path(path))
+
+    path_key = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    cache_file = CACHE_DIR / f"{kind}_{path_key}_{head}.pkl"
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    value = None
+    if kind == "commits":
+        value = _extend_previous_commits(Path(path), path_key, head)
+    if value is None:
+        value = _compute(kind, Path(path))
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(pickle.dumps(value))
+    return value
+
+
+def get_commit_analysis(path: Path) -> list:
+    """Cached ``CommitAnalyzer(path).analyze_commits()``. Do not mutate the result."""
+    path = path.resolve()
+    return _cached("commits", str(path), _head_sha(path))
+
+
+def get_commit_stats(path: Path) -> tuple[Counter, int, int]:
+    """Cached (category counts, total churn, commit count) streamed from git log."""
+    path = path.resolve()
+    return _cached("stats", str(path), _head_sha(path))
+
+
+def get_repo_summary(path: Path) -> dict:
+    """Cached ``CodeAnalyzer(path).get_repo_summary()``. Do not mutate the result."""
+    path = path.resolve()
+    head = _head_sha(path)
+    dirty = _worktree_digest(path) if head else ""
+    return _cached("summary", str(path), f"{head}-{dirty}" if dirty else head)
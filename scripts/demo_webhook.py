@@ -10,6 +10,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
+import hashlib
+import json
+import orjson
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
@@ -19,128 +22,184 @@ load_dotenv()
 
 console = Console()
 
+# Fixed review rubric + schema. Sent as a cached system block so only the
+# PR-specific user turn is billed in full on repeated runs.
+STATIC_REVIEW_PROMPT = """You are an expert code reviewer. Review the GitHub PR diff in the next message and identify issues.
 
-async def demo_review_diff(repo_path: Path):
-    """Demo: Review the latest commit as if it were a PR."""
+## Review Instructions
+1. Check for security vulnerabilities
+2. Check for bugs and logic errors
+3. Check for breaking changes
+4. Check for missing error handling
+5. Consider the impact of these changes
+
+Provide your review in this JSON format:
+{
+    "risk_score": <0-100>,
+    "quality_score": <0-100>,
+    "issues": [
+        {
+            "severity": "<critical|warning|suggestion>",
+            "category": "<security|performance|maintainability|bug|style>",
+            "file": "<filename>",
+            "message": "<description of issue>",
+            "suggestion": "<how to fix>"
+        }
+    ],
+    "summary": "<1-2 sentence summary of the changes and their quality>",
+    "merge_recommendation": "<approve|request_changes|needs_discussion>"
+}
+
+Return ONLY valid JSON."""
+
+# Token budget for the diff portion of the user turn
+MAX_DIFF_TOKENS = 6000
+
+# Bump when STATIC_REVIEW_PROMPT changes so stale cached reviews are ignored.
+PROMPT_VERSION = "v1"
+
+REVIEW_CACHE_DIR = Path(__file__).parent.parent / "data" / "review_cache"
+
+
+def _review_cache_key(model: str, pr_title: str, diff: str) -> str:
+    """Hash the inputs that determine the LLM review."""
+    return hashlib.blake2b(
+        f"{model}\0{pr_title}\0{diff}\0{PROMPT_VERSION}".encode()
+    ).hexdigest()
+
+
+def _load_cached_review(key: str) -> dict | None:
+    """Return a previously parsed LLM review, if any."""
+    cache_file = REVIEW_CACHE_DIR / f"{key}.json"
+    if not cache_file.exists():
+        return None
+    try:
+        return orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _save_cached_review(key: str, llm_result: dict) -> None:
+    """Persist a successfully parsed LLM review."""
+    REVIEW_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (REVIEW_CACHE_DIR / f"{key}.json").write_bytes(orjson.dumps(llm_result))
+
+
+def _read_last_commit(repo_path: Path) -> tuple[str, list[str], bytes]:
+    """Return (subject, changed files, raw patch bytes) for HEAD with a single git call.
+
+    The patch is left undecoded; only the part that fits the prompt is decoded later.
+    """
     import subprocess
 
-    # Get the diff from last commit
     result = subprocess.run(
-        ["git", "diff", "HEAD~1"],
+        [
+            "git", "show", "--format=%s%x00", "--raw", "--patch",
+            # Minimal context, and no body for deleted files: fewer prompt tokens
+            "--unified=1", "--irreversible-delete", "--no-color",
+            # A merge HEAD shows what it brought in, like `git diff HEAD~1`
+            "--diff-merges=first-parent",
+            "HEAD",
+        ],
         cwd=repo_path,
         capture_output=True,
-        text=True,
     )
-    diff = result.stdout
+    title, _, body = result.stdout.partition(b"\0")
+
+    # --raw lines (":<mode> <mode> <sha> <sha> <status>\t<path>") precede the patch
+    diff_start = body.find(b"diff --git ")
+    raw = body if diff_start == -1 else body[:diff_start]
+    files = [
+        line.split("\t")[-1]
+        for line in raw.decode("utf-8", errors="replace").splitlines()
+        if line.startswith(":") and "\t" in line
+    ]
+
+    diff = b"" if diff_start == -1 else body[diff_start:]
+    return title.decode("utf-8", errors="replace").strip(), files, diff
+
+
+async def demo_review_diff(repo_path: Path):
+    """Demo: Review the latest commit as if it were a PR."""
+    # Commit subject ("PR title"), changed files and patch in one git call
+    pr_title, files, diff = _read_last_commit(repo_path)
 
     if not diff.strip():
         console.print("[yellow]No changes in last commit[/yellow]")
         return
 
-    # Get commit message as "PR title"
-    result = subprocess.run(
-        ["git", "log", "-1", "--pretty=%s"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-    )
-    pr_title = result.stdout.strip()
-
-    # Count files
-    result = subprocess.run(
-        ["git", "diff", "--name-only", "HEAD~1"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-    )
-    files = [f for f in result.stdout.strip().split("\n") if f]
-
     console.print(Panel(
         f"[bold]Simulating PR Review[/bold]\n\n"
         f"Title: {pr_title}\n"
         f"Files: {len(files)}\n"
-        f"Diff size: {len(diff)} chars",
+        f"Diff size: {len(diff):,} bytes",
         title="Demo Webhook",
         border_style="blue",
     ))
 
     # Run the review
-    from src.utils.llm_client import get_llm_client
+    from src.utils.diff import decode_diff, truncate_diff
+    from src.utils.llm_client import get_llm_client, parse_json_response
     from src.api.github_webhook import format_review_comment
     from src.reviewer.code_reviewer import ReviewResult, ReviewIssue
-    import json
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        progress.add_task("Running AI review...", total=None)
-
-        llm = get_llm_client()
-
-        prompt = f"""You are an expert code reviewer. Review this GitHub PR diff and identify issues.
+    # Decode only reviewable files, then pack whole file diffs into the token budget
+    diff = decode_diff(diff, max_bytes=MAX_DIFF_TOKENS * 8)
+    diff = truncate_diff(diff, max_tokens=MAX_DIFF_TOKENS)
+    if not diff.strip():
+        console.print("[yellow]Only generated or binary files changed in last commit[/yellow]")
+        return
 
-## PR Title: {pr_title}
+    llm = get_llm_client()
+    cache_key = _review_cache_key(llm.model, pr_title, diff)
+    llm_result = _load_cached_review(cache_key)
+
+    if llm_result is not None:
+        console.print("[dim]Using cached review for this diff[/dim]")
+    else:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=2,
+            transient=True,
+        ) as progress:
+            progress.add_task("Running AI review...", total=None)
+
+            prompt = f"""## PR Title: {pr_title}
 ## Files Changed: {len(files)}
 
 ## Diff
 ```diff
-{diff[:10000]}
-```
-
-## Review Instructions
-1. Check for security vulnerabilities
-2. Check for bugs and logic errors
-3. Check for breaking changes
-4. Check for missing error handling
-5. Consider the impact of these changes
-
-Provide your review in this JSON format:
-{{
-    "risk_score": <0-100>,
-    "quality_score": <0-100>,
-    "issues": [
-        {{
-            "severity": "<critical|warning|suggestion>",
-            "category": "<security|performance|maintainability|bug|style>",
-            "file": "<filename>",
-            "message": "<description of issue>",
-            "suggestion": "<how to fix>"
-        }}
-    ],
-    "summary": "<1-2 sentence summary of the changes and their quality>",
-    "merge_recommendation": "<approve|request_changes|needs_discussion>"
-}}
-
-Return ONLY valid JSON."""
-
-        content = llm.complete(prompt, max_tokens=2048, temperature=0.2)
-
-    try:
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        llm_result = json.loads(content.strip())
-    except (json.JSONDecodeError, IndexError):
-        llm_result = {
-            "risk_score": 50,
-            "quality_score": 50,
-            "issues": [],
-            "summary": "Unable to analyze PR",
-            "merge_recommendation": "needs_discussion",
-        }
+{diff}
+```"""
+
+            content = llm.complete(
+                prompt, max_tokens=2048, temperature=0.2, system=STATIC_REVIEW_PROMPT
+            )
+
+        try:
+            llm_result = parse_json_response(content)
+            _save_cached_review(cache_key, llm_result)
+        except json.JSONDecodeError:
+            llm_result = {
+                "risk_score": 50,
+                "quality_score": 50,
+                "issues": [],
+                "summary": "Unable to analyze PR",
+                "merge_recommendation": "needs_discussion",
+            }
 
     # Create result object
+    # Positional args: severity, category, file, line, message, suggestion
     issues = [
         ReviewIssue(
-            severity=i.get("severity", "suggestion"),
-            category=i.get("category", "maintainability"),
-            file=i.get("file", "unknown"),
-            line=None,
-            message=i.get("message", ""),
-            suggestion=i.get("suggestion"),
+            i.get("severity", "suggestion"),
+            i.get("category", "maintainability"),
+            i.get("file", "unknown"),
+            None,
+            i.get("message", ""),
+            i.get("suggestion"),
         )
         for i in llm_result.get("issues", [])
     ]
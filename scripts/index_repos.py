@@ -3,13 +3,18 @@
 Script to index all repositories in the parent directory.
 """
 
+import asyncio
 import os
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import orjson
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -21,6 +26,138 @@ load_dotenv()
 
 console = Console()
 
+# Cap on repos being written to Chroma / embedded at the same time
+MAX_CONCURRENT_INDEXING = 4
+
+
+def _load_index_state(state_path: Path) -> dict[str, str]:
+    """Load the last indexed commit SHA per repo."""
+    if not state_path.exists():
+        return {}
+    try:
+        return orjson.loads(state_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _read_head_sha(repo_path: Path) -> str | None:
+    """Resolve HEAD from .git files without spawning git."""
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # detached HEAD
+
+        ref = head[5:]
+        ref_path = git_dir / ref
+        if ref_path.exists():
+            return ref_path.read_text().strip()
+
+        # Ref may only exist in packed-refs
+        packed = git_dir / "packed-refs"
+        if packed.exists():
+            for line in packed.read_text().splitlines():
+                if line.endswith(f" {ref}"):
+                    return line.partition(" ")[0]
+    except OSError:
+        pass
+    return None
+
+
+def _analyze_repo(repo_path: Path, output_path: Path, since: str | None) -> tuple[list, list]:
+    """Walk a repo's new history (runs in a worker process).
+
+    Returns (all known commits, commits not reachable from ``since``). If
+    ``since`` is gone from the history (e.g. after a rebase), the history is
+    rebuilt from scratch instead of merged onto the old dump.
+    """
+    analyzer = CommitAnalyzer(repo_path)
+    if since and not analyzer.is_ancestor(since):
+        since = None
+    new_commits = analyzer.analyze_commits(since=since)
+
+    all_commits = new_commits
+    if since and output_path.exists():
+        all_commits = CommitAnalyzer.merge_commits(
+            CommitAnalyzer.load_from_json(output_path), new_commits
+        )
+
+    return all_commits, new_commits
+
+
+async def index_all(repos: list[Path], data_dir: Path, progress, task) -> tuple[int, list]:
+    """Analyze repos in parallel processes and index them concurrently."""
+    loop = asyncio.get_running_loop()
+    estimator = TaskEstimator(chroma_path=str(data_dir / "chroma"))
+    state_path = data_dir / "index_state.json"
+    state = _load_index_state(state_path)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_INDEXING)
+    chroma_lock = threading.Lock()
+    savers: list[threading.Thread] = []
+
+    def index_new_commits(commits, repo_name):
+        # The shared Chroma client is not guaranteed to be thread-safe, but
+        # embedding is: only Chroma reads and writes hold the lock
+        with chroma_lock:
+            indexed = estimator.get_indexed_shas(repo_name)
+        commits = [c for c in commits if c.sha not in indexed]
+        return estimator.index_commits(commits, repo_name, lock=chroma_lock)
+
+    async def process_repo(pool: ProcessPoolExecutor, repo_path: Path) -> tuple[int, list]:
+        if not repo_path.exists() or not (repo_path / ".git").exists():
+            console.print(f"[yellow]Skipping {repo_path.name}[/yellow]")
+            progress.advance(task)
+            return 0, []
+
+        last_sha = state.get(repo_path.name)
+        head = _read_head_sha(repo_path)
+        output_path = data_dir / f"{repo_path.name}_commits.json"
+        if last_sha and head and head.startswith(last_sha) and output_path.exists():
+            console.print(f"[dim]{repo_path.name} unchanged, skipping[/dim]")
+            # Nothing to index, but its commits still count in the summary
+            commits = await asyncio.to_thread(CommitAnalyzer.load_from_json, output_path)
+            progress.advance(task)
+            return 0, commits
+
+        console.print(f"[blue]Analyzing {repo_path.name}...[/blue]")
+        commits, new_commits = await loop.run_in_executor(
+            pool, _analyze_repo, repo_path, output_path, last_sha
+        )
+
+        # Write the JSON dump in the background while the same in-memory commits are indexed
+        saver = threading.Thread(
+            target=CommitAnalyzer.save_to_json, args=(commits, output_path), daemon=True
+        )
+        saver.start()
+        savers.append(saver)
+
+        # Index for RAG, skipping anything Chroma already has
+        async with semaphore:
+            count = await asyncio.to_thread(index_new_commits, new_commits, repo_path.name)
+
+        # The HEAD read above, so the unchanged check matches next run even when
+        # the tip is not the newest commit by date; else the newest known commit
+        if head:
+            state[repo_path.name] = head
+        elif commits:
+            state[repo_path.name] = commits[-1].sha
+
+        console.print(f"  [green]✓ {count} new commits indexed[/green]")
+        progress.advance(task)
+        return count, commits
+
+    with ProcessPoolExecutor() as pool:
+        results = await asyncio.gather(*(process_repo(pool, p) for p in repos))
+
+    for saver in savers:
+        saver.join()
+
+    state_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+
+    total_indexed = sum(count for count, _ in results)
+    total_commits = [c for _, commits in results for c in commits]
+    return total_indexed, total_commits
+
 
 def main():
     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -43,44 +180,18 @@ def main():
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=2,
+        transient=True,
     ) as progress:
         task = progress.add_task("Indexing repositories...", total=len(repos))
-
-        estimator = TaskEstimator(api_key, chroma_path=str(data_dir / "chroma"))
-        total_indexed = 0
-        total_commits = []
-
-        for repo_path in repos:
-            if not repo_path.exists() or not (repo_path / ".git").exists():
-                console.print(f"[yellow]Skipping {repo_path.name}[/yellow]")
-                progress.advance(task)
-                continue
-
-            console.print(f"[blue]Analyzing {repo_path.name}...[/blue]")
-
-            analyzer = CommitAnalyzer(repo_path)
-            commits = analyzer.analyze_commits()
-
-            # Save to JSON
-            analyzer.save_to_json(commits, data_dir / f"{repo_path.name}_commits.json")
-
-            # Index for RAG
-            count = estimator.index_commits(commits, repo_path.name)
-            total_indexed += count
-            total_commits.extend(commits)
-
-            console.print(f"  [green]✓ {count} commits indexed[/green]")
-            progress.advance(task)
+        total_indexed, total_commits = asyncio.run(index_all(repos, data_dir, progress, task))
 
     console.print(f"\n[bold green]Done! Indexed {total_indexed} commits[/bold green]")
 
     # Print summary stats
     console.print("\n[bold]Summary:[/bold]")
-    categories = {}
-    for c in total_commits:
-        categories[c.category] = categories.get(c.category, 0) + 1
-
-    for cat, count in sorted(categories.items(), key=lambda x: -x[1]):
+    categories = Counter(c.category for c in total_commits)
+    for cat, count in categories.most_common():
         console.print(f"  {cat}: {count}")
 
 
@@ -1,4 +1,4 @@
-from .commit_analyzer import CommitAnalyzer, CommitData
+from .commit_analyzer import CommitAnalyzer, CommitData, CommitStats
 from .code_analyzer import CodeAnalyzer, CodeMetrics
 
-__all__ = ["CommitAnalyzer", "CommitData", "CodeAnalyzer", "CodeMetrics"]
+__all__ = ["CommitAnalyzer", "CommitData", "CommitStats", "CodeAnalyzer", "CodeMetrics"]
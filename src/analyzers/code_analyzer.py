@@ -2,9 +2,26 @@
 Static code analysis for complexity metrics.
 """
 
-import subprocess
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
+
+# Directories never worth analyzing (dependencies, build output, VCS, envs)
+_SKIP_DIR_RE = re.compile(r"node_modules|dist|\.git|__pycache__|venv")
+
+# Branch points counted by the TS/JS complexity heuristic, matched in one scan:
+# " if", " for", " while" before a space or "(", and " else", " switch", " case",
+# " catch", " ?", " &&", " ||" before a space. Trailing chars are lookaheads so
+# adjacent tokens such as " else if (" are both counted.
+_TS_COMPLEXITY_RE = re.compile(
+    r" (?:if|for|while)(?=[ (])| (?:else|switch|case|catch|\?|&&|\|\|)(?= )"
+)
+
+# Below this many files, process pool startup costs more than it saves
+_MIN_FILES_FOR_POOL = 32
 
 
 @dataclass
@@ -35,7 +52,10 @@ class CodeAnalyzer:
     COMPLEXITY_THRESHOLD = 10  # Cyclomatic complexity
     LONG_FUNCTION_LINES = 50
     LARGE_FILE_LINES = 500
+    MEDIUM_FILE_LINES = 200
     DEEP_NESTING_LEVEL = 4
+    LOW_COMMENT_RATIO = 0.05  # Penalized only above COMMENT_CHECK_MIN_LINES
+    COMMENT_CHECK_MIN_LINES = 100
 
     SUPPORTED_EXTENSIONS = {
         ".py": "python",
@@ -54,92 +74,64 @@ class CodeAnalyzer:
         return self.SUPPORTED_EXTENSIONS.get(file_path.suffix.lower(), "unknown")
 
     def _analyze_python_file(self, file_path: Path) -> CodeMetrics:
-        """Analyze Python file using radon."""
+        """Analyze Python file using radon (in-process, no subprocess)."""
         try:
-            # Get cyclomatic complexity
-            result = subprocess.run(
-                ["radon", "cc", "-a", "-j", str(file_path)],
-                capture_output=True,
-                text=True,
-            )
+            from radon.complexity import cc_visit
+            from radon.raw import analyze as raw_analyze
 
-            # Get raw metrics
-            raw_result = subprocess.run(
-                ["radon", "raw", "-j", str(file_path)],
-                capture_output=True,
-                text=True,
-            )
-
-            # Parse results
-            avg_complexity = 0.0
-            loc = 0
+            source = file_path.read_text(encoding="utf-8", errors="ignore")
 
-            if result.returncode == 0:
-                import json
-
-                try:
-                    data = json.loads(result.stdout)
-                    if file_path.name in data:
-                        blocks = data[file_path.name]
-                        if blocks:
-                            complexities = [b.get("complexity", 0) for b in blocks]
-                            avg_complexity = sum(complexities) / len(complexities)
-                except (json.JSONDecodeError, KeyError):
-                    pass
-
-            if raw_result.returncode == 0:
-                import json
-
-                try:
-                    data = json.loads(raw_result.stdout)
-                    if str(file_path) in data:
-                        loc = data[str(file_path)].get("loc", 0)
-                except (json.JSONDecodeError, KeyError):
-                    pass
+            # Functions, methods and classes, as reported by `radon cc -a`
+            blocks = cc_visit(source)
+            avg_complexity = (
+                sum(b.complexity for b in blocks) / len(blocks) if blocks else 0.0
+            )
 
             return CodeMetrics(
                 file_path=str(file_path),
                 language="python",
                 cyclomatic_complexity=avg_complexity,
-                lines_of_code=loc,
+                lines_of_code=raw_analyze(source).loc,
             )
 
         except Exception:
             return CodeMetrics(file_path=str(file_path), language="python")
 
-    def _analyze_typescript_file(self, file_path: Path) -> CodeMetrics:
-        """Analyze TypeScript/JavaScript file."""
+    def _analyze_python_files_bulk(self, paths: list[Path]) -> dict[Path, CodeMetrics]:
+        """Analyze many Python files in one process with a single radon import."""
+        results = {}
+        for path in paths:
+            metrics = self._analyze_python_file(path)
+            metrics.risk_score = self._calculate_risk_score(metrics)
+            results[path] = metrics
+        return results
+
+    def _analyze_typescript_file(self, file_path: Path, language: str) -> CodeMetrics:
+        """Analyze TypeScript/JavaScript file (``language`` is already detected)."""
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
             lines = content.split("\n")
-            loc = len([l for l in lines if l.strip() and not l.strip().startswith("//")])
-
-            # Simple complexity heuristics
-            complexity_indicators = [
-                content.count(" if "),
-                content.count(" if("),
-                content.count(" else "),
-                content.count(" for "),
-                content.count(" for("),
-                content.count(" while "),
-                content.count(" while("),
-                content.count(" switch "),
-                content.count(" case "),
-                content.count(" catch "),
-                content.count(" ? "),  # ternary
-                content.count(" && "),
-                content.count(" || "),
-            ]
-
-            estimated_complexity = sum(complexity_indicators) / max(1, loc / 50)
+
+            # One pass over the lines for both code and comment counts
+            loc = 0
+            comment_lines = 0
+            for line in lines:
+                stripped = line.strip()
+                if stripped.startswith("//"):
+                    comment_lines += 1
+                elif stripped:
+                    loc += 1
+
+            # Simple complexity heuristic: branch points per 50 lines
+            branch_points = sum(1 for _ in _TS_COMPLEXITY_RE.finditer(content))
+            estimated_complexity = branch_points / max(1, loc / 50)
 
             # Count long functions (heuristic: functions with many lines between braces)
             long_functions = 0
-            comment_lines = len([l for l in lines if l.strip().startswith("//")])
 
             return CodeMetrics(
                 file_path=str(file_path),
-                language=self._detect_language(file_path),
+                language=language,
                 cyclomatic_complexity=estimated_complexity,
                 lines_of_code=loc,
                 comment_ratio=comment_lines / max(1, len(lines)),
@@ -148,7 +140,7 @@ class CodeAnalyzer:
 
         except Exception:
             return CodeMetrics(
-                file_path=str(file_path), language=self._detect_language(file_path)
+                file_path=str(file_path), language=language
             )
 
     def analyze_file(self, file_path: Path) -> CodeMetrics:
@@ -158,7 +150,7 @@ class CodeAnalyzer:
         if language == "python":
             metrics = self._analyze_python_file(file_path)
         elif language in ("typescript", "javascript"):
-            metrics = self._analyze_typescript_file(file_path)
+            metrics = self._analyze_typescript_file(file_path, language)
         else:
             # Basic analysis for other languages
             try:
@@ -186,35 +178,52 @@ class CodeAnalyzer:
         # Size factor (0-30 points)
         if metrics.lines_of_code > self.LARGE_FILE_LINES:
             score += 30
-        elif metrics.lines_of_code > 200:
+        elif metrics.lines_of_code > self.MEDIUM_FILE_LINES:
             score += 15
 
         # Long functions factor (0-20 points)
         score += min(20, metrics.long_functions * 5)
 
         # Low comment ratio penalty (0-10 points)
-        if metrics.comment_ratio < 0.05 and metrics.lines_of_code > 100:
+        if (
+            metrics.comment_ratio < self.LOW_COMMENT_RATIO
+            and metrics.lines_of_code > self.COMMENT_CHECK_MIN_LINES
+        ):
             score += 10
 
         return min(100, score)
 
-    def analyze_directory(self, dir_path: Path = None) -> list[CodeMetrics]:
-        """Analyze all supported files in a directory."""
+    def _iter_source_files(self, root: Path) -> Iterator[Path]:
+        """Yield supported files under root from one walk that prunes skipped dirs."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            # In-place assignment stops os.walk from descending into them at all
+            dirnames[:] = [d for d in dirnames if not _SKIP_DIR_RE.search(d)]
+            for name in filenames:
+                if os.path.splitext(name)[1].lower() in self.SUPPORTED_EXTENSIONS:
+                    yield Path(dirpath, name)
+
+    def analyze_directory(
+        self, dir_path: Path = None, workers: int | None = None
+    ) -> list[CodeMetrics]:
+        """Analyze all supported files in a directory.
+
+        Files are analyzed in parallel on ``workers`` processes (default: one
+        per CPU); ``workers=1`` or a small tree runs in-process.
+        """
         if dir_path is None:
             dir_path = self.repo_path
 
-        metrics = []
-        for ext in self.SUPPORTED_EXTENSIONS:
-            for file_path in dir_path.rglob(f"*{ext}"):
-                # Skip node_modules, dist, etc.
-                if any(
-                    skip in str(file_path)
-                    for skip in ["node_modules", "dist", ".git", "__pycache__", "venv"]
-                ):
-                    continue
-                metrics.append(self.analyze_file(file_path))
+        files = list(self._iter_source_files(dir_path))
 
-        return metrics
+        if workers == 1 or len(files) < _MIN_FILES_FOR_POOL:
+            # Python files go through radon in one batch; the rest one at a time
+            python_metrics = self._analyze_python_files_bulk(
+                [f for f in files if self._detect_language(f) == "python"]
+            )
+            return [python_metrics.get(f) or self.analyze_file(f) for f in files]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.analyze_file, files, chunksize=16))
 
     def get_repo_summary(self) -> dict:
         """Get a summary of the entire repository's code quality."""
@@ -223,12 +232,25 @@ class CodeAnalyzer:
         if not all_metrics:
             return {"total_files": 0, "avg_risk_score": 0}
 
+        # All aggregates in one pass over the metrics
+        total_loc = 0
+        total_complexity = 0.0
+        total_risk = 0.0
+        high_risk_files = []
+        languages = set()
+        for m in all_metrics:
+            total_loc += m.lines_of_code
+            total_complexity += m.cyclomatic_complexity
+            total_risk += m.risk_score
+            if m.risk_score > 50:
+                high_risk_files.append(m.file_path)
+            languages.add(m.language)
+
         return {
             "total_files": len(all_metrics),
-            "total_loc": sum(m.lines_of_code for m in all_metrics),
-            "avg_complexity": sum(m.cyclomatic_complexity for m in all_metrics)
-            / len(all_metrics),
-            "avg_risk_score": sum(m.risk_score for m in all_metrics) / len(all_metrics),
-            "high_risk_files": [m.file_path for m in all_metrics if m.risk_score > 50],
-            "languages": list(set(m.language for m in all_metrics)),
+            "total_loc": total_loc,
+            "avg_complexity": total_complexity / len(all_metrics),
+            "avg_risk_score": total_risk / len(all_metrics),
+            "high_risk_files": high_risk_files,
+            "languages": list(languages),
         }
@@ -2,14 +2,16 @@
 Analyzes git commit history to extract features for ML/estimation.
 """
 
-import json
-from dataclasses import dataclass, field, asdict
+import re
+import subprocess
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
-from git import Repo
-from git.objects.commit import Commit
+import orjson
+
+from src.utils.diff import GENERATED_FILE_RE
 
 
 @dataclass
@@ -48,6 +50,26 @@ class CommitData:
         return cls(**d)
 
 
+def _keyword_matcher(keywords: dict[str, list[str]]) -> re.Pattern:
+    """Compile category keywords into one pattern whose ``lastgroup`` is the category.
+
+    Each category is a lookahead branch tried in dict order, so the first
+    category with any keyword anywhere in the text wins, as with nested loops.
+    """
+    branches = (
+        f"(?=.*?(?P<{category}>{'|'.join(re.escape(kw) for kw in kws)}))"
+        for category, kws in keywords.items()
+    )
+    return re.compile("|".join(branches), re.DOTALL)
+
+
+class CommitStats(NamedTuple):
+    """The per-commit fields needed for repository-level aggregates."""
+
+    category: str
+    total_churn: int
+
+
 class CommitAnalyzer:
     """Extracts commit data from a git repository."""
 
@@ -64,64 +86,126 @@ class CommitAnalyzer:
         "feature": ["add", "implement", "create", "new", "feature"],
     }
 
+    _CATEGORY_RE = _keyword_matcher(CATEGORY_KEYWORDS)
+
+    # One record per commit: RS, then US-separated sha / mailmapped author / commit time /
+    # raw body, followed by the commit's NUL-separated --numstat entries
+    LOG_FORMAT = "%x1e%H%x1f%aN%x1f%ct%x1f%B%x1f"
+
     def __init__(self, repo_path: str | Path):
         self.repo_path = Path(repo_path)
-        self.repo = Repo(repo_path)
 
     def _categorize_commit(self, message: str, files: list[str]) -> str:
         """Categorize commit based on message and files."""
-        msg_lower = message.lower()
-
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in msg_lower for kw in keywords):
-                return category
-
-        # Check file paths
-        file_str = " ".join(files).lower()
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in file_str for kw in keywords):
-                return category
-
-        return "other"
-
-    def _extract_commit_stats(self, commit: Commit) -> tuple[int, int, int, list[str]]:
-        """Extract file change statistics from a commit."""
+        match = self._CATEGORY_RE.match(message.lower()) or self._CATEGORY_RE.match(
+            " ".join(files).lower()
+        )
+        return match.lastgroup if match else "other"
+
+    def _parse_log_record(self, record: bytes) -> tuple[str, str, int, str, list[str], int, int]:
+        """Parse one ``LOG_FORMAT`` record plus its ``-z --numstat`` entries."""
+        sha, author, committed, message, numstat = record.split(b"\x1f", 4)
+
+        files = []
+        insertions = 0
+        deletions = 0
+
+        entries = iter(numstat.split(b"\0"))
+        for entry in entries:
+            entry = entry.strip(b"\n")
+            if not entry:
+                continue
+            added, deleted, path = entry.split(b"\t", 2)
+            if not path:
+                # Rename/copy: old and new paths follow as separate entries
+                next(entries, None)
+                path = next(entries, b"")
+            path = path.decode("utf-8", errors="replace")
+            if GENERATED_FILE_RE.search(path):
+                continue  # lockfile/bundle churn would swamp the real work
+            files.append(path)
+            if added != b"-":  # binary files report "-"
+                insertions += int(added)
+                deletions += int(deleted)
+
+        return (
+            sha.decode(),
+            author.decode("utf-8", errors="replace"),
+            int(committed),
+            message.decode("utf-8", errors="replace"),
+            files,
+            insertions,
+            deletions,
+        )
+
+    def _iter_log(
+        self, max_commits: int, revision: str = "HEAD"
+    ) -> Iterator[tuple[str, str, int, str, list[str], int, int]]:
+        """Stream commits of ``revision``, newest first, from a single ``git log`` process.
+
+        Raises ValueError if git fails (e.g. not a repository or no commits yet).
+        """
+        proc = subprocess.Popen(
+            [
+                "git", "log", f"--max-count={max_commits}", f"--format={self.LOG_FORMAT}",
+                "-z", "--numstat", "-M", "--diff-merges=first-parent", revision,
+            ],
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        buffer = b""
         try:
-            if commit.parents:
-                diff = commit.parents[0].diff(commit)
-            else:
-                # Initial commit
-                diff = commit.diff(None)
-
-            files = []
-            insertions = 0
-            deletions = 0
-
-            for d in diff:
-                if d.a_path:
-                    files.append(d.a_path)
-                elif d.b_path:
-                    files.append(d.b_path)
-
-            # Get stats from commit
-            stats = commit.stats.total
-            insertions = stats.get("insertions", 0)
-            deletions = stats.get("deletions", 0)
-
-            return len(files), insertions, deletions, files
-
-        except Exception:
-            return 0, 0, 0, []
-
-    def analyze_commits(self, max_commits: int = 500) -> list[CommitData]:
-        """Analyze all commits in the repository."""
+            for chunk in iter(lambda: proc.stdout.read(65536), b""):
+                buffer += chunk
+                *records, buffer = buffer.split(b"\x1e")
+                for record in records:
+                    if record:
+                        yield self._parse_log_record(record)
+            if buffer:
+                yield self._parse_log_record(buffer)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+        # Only reached when the log was read to the end, not on early close
+        if returncode != 0:
+            raise ValueError(f"git log failed in {self.repo_path} (exit {returncode})")
+
+    def iter_commit_stats(self, max_commits: int = 500) -> Iterator[CommitStats]:
+        """Stream (category, churn) per commit, newest first, without building CommitData."""
+        for _, _, _, message, file_list, insertions, deletions in self._iter_log(max_commits):
+            yield CommitStats(self._categorize_commit(message, file_list), insertions + deletions)
+
+    def is_ancestor(self, sha: str) -> bool:
+        """Whether ``sha`` (short SHAs accepted) exists and is reachable from HEAD."""
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", sha, "HEAD"],
+            cwd=self.repo_path,
+            capture_output=True,
+        )
+        return result.returncode == 0
+
+    def analyze_commits(
+        self, max_commits: int = 500, since: Optional[str] = None
+    ) -> list[CommitData]:
+        """Analyze all commits in the repository.
+
+        If ``since`` is given, only commits reachable from HEAD but not from
+        that SHA (``since..HEAD``) are walked, including older commits of
+        branches merged since; short SHAs are accepted. If ``since`` is not
+        reachable from HEAD (e.g. after a rebase) the full history is walked,
+        so callers merging onto earlier results check ``is_ancestor`` first.
+        """
         commits_data = []
         prev_timestamp = None
+        if since and not self.is_ancestor(since):
+            since = None
+        revision = f"{since}..HEAD" if since else "HEAD"
 
-        for commit in list(self.repo.iter_commits("HEAD", max_count=max_commits)):
-            files_changed, insertions, deletions, file_list = self._extract_commit_stats(commit)
-
-            timestamp = datetime.fromtimestamp(commit.committed_date)
+        for sha, author, committed, message, file_list, insertions, deletions in self._iter_log(
+            max_commits, revision
+        ):
+            timestamp = datetime.fromtimestamp(committed)
 
             # Calculate time since last commit
             time_since_last = None
@@ -130,36 +214,66 @@ class CommitAnalyzer:
                 time_since_last = delta.total_seconds() / 3600  # hours
 
             data = CommitData(
-                sha=commit.hexsha[:7],
-                message=commit.message.strip().split("\n")[0],  # First line only
-                author=commit.author.name,
+                sha=sha[:7],
+                message=message.lstrip().partition("\n")[0].rstrip(),  # First line only
+                author=author,
                 timestamp=timestamp,
-                files_changed=files_changed,
+                files_changed=len(file_list),
                 insertions=insertions,
                 deletions=deletions,
                 file_list=file_list,
                 total_churn=insertions + deletions,
                 time_since_last_commit_hours=time_since_last,
-                category=self._categorize_commit(commit.message, file_list),
+                category=self._categorize_commit(message, file_list),
             )
 
             commits_data.append(data)
             prev_timestamp = timestamp
 
-        # Reverse to chronological order
-        return list(reversed(commits_data))
-
-    def save_to_json(self, commits: list[CommitData], output_path: Path) -> None:
+        # Reverse to chronological order, in place rather than via a copy
+        commits_data.reverse()
+        return commits_data
+
+    @staticmethod
+    def merge_commits(
+        previous: list[CommitData], new_commits: list[CommitData], max_commits: int | None = None
+    ) -> list[CommitData]:
+        """Combine an incremental ``analyze_commits(since=...)`` run with an earlier one.
+
+        Both lists are chronological. New commits from merged branches may be
+        older than the previous newest commit, so the result is re-sorted by
+        time and ``time_since_last_commit_hours`` is recomputed wherever a
+        commit's later neighbour changed. Keeps the newest ``max_commits`` if given.
+        """
+        new_shas = {c.sha for c in new_commits}
+        merged = [c for c in previous if c.sha not in new_shas]
+        merged.extend(new_commits)
+        merged.sort(key=lambda c: c.timestamp)  # Stable: equal times keep log order
+
+        for i, commit in enumerate(merged):
+            hours = None
+            if i + 1 < len(merged):
+                hours = (merged[i + 1].timestamp - commit.timestamp).total_seconds() / 3600
+            if commit.time_since_last_commit_hours != hours:
+                merged[i] = replace(commit, time_since_last_commit_hours=hours)
+
+        if max_commits is not None:
+            merged = merged[-max_commits:]
+        return merged
+
+    @staticmethod
+    def save_to_json(commits: list[CommitData], output_path: Path) -> None:
         """Save commit data to JSON file."""
         data = [c.to_dict() for c in commits]
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
-    def load_from_json(self, input_path: Path) -> list[CommitData]:
+    @staticmethod
+    def load_from_json(input_path: Path) -> list[CommitData]:
         """Load commit data from JSON file."""
-        with open(input_path) as f:
-            data = json.load(f)
+        with open(input_path, "rb") as f:
+            data = orjson.loads(f.read())
         return [CommitData.from_dict(d) for d in data]
 
 
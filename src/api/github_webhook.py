@@ -170,7 +170,7 @@ async def review_pr(owner: str, repo: str, pr_number: int, pr_title: str):
     reviewer = CodeReviewer()
 
     # Create a mock review from diff content
-    from src.utils.llm_client import get_llm_client
+    from src.utils.llm_client import get_llm_client, parse_json_response
     import json
 
     llm = get_llm_client()
@@ -214,12 +214,8 @@ Return ONLY valid JSON."""
     content = llm.complete(prompt, max_tokens=2048, temperature=0.2)
 
     try:
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        llm_result = json.loads(content.strip())
-    except (json.JSONDecodeError, IndexError):
+        llm_result = parse_json_response(content)
+    except json.JSONDecodeError:
         llm_result = {
             "risk_score": 50,
             "quality_score": 50,
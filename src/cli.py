@@ -3,19 +3,15 @@ CLI interface for AI Engineering Quality system.
 """
 
 import os
+from collections import Counter
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import box
 from dotenv import load_dotenv
 
-from src.analyzers.commit_analyzer import CommitAnalyzer
-from src.analyzers.code_analyzer import CodeAnalyzer
-
 load_dotenv()
 
 app = typer.Typer(
@@ -31,21 +27,32 @@ def check_api_key() -> bool:
     return bool(os.getenv("OPENROUTER_API_KEY") or os.getenv("ANTHROPIC_API_KEY"))
 
 
+def _spinner():
+    """Spinner progress display; rich.progress is imported only when a command runs."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
+
 @app.command()
 def analyze(
     repo_path: Path = typer.Argument(..., help="Path to git repository"),
     output_dir: Path = typer.Option("./data", help="Output directory for analysis"),
 ):
     """Analyze a repository's commit history."""
+    from rich.table import Table
+
+    from src.analyzers.commit_analyzer import CommitAnalyzer
+
     if not repo_path.exists():
         console.print(f"[red]Repository not found: {repo_path}[/red]")
         raise typer.Exit(1)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         progress.add_task("Analyzing commits...", total=None)
 
         analyzer = CommitAnalyzer(repo_path)
@@ -64,45 +71,56 @@ def analyze(
     table.add_row("Total Churn", f"{sum(c.total_churn for c in commits):,} lines")
 
     # Category breakdown
-    categories = {}
-    for c in commits:
-        categories[c.category] = categories.get(c.category, 0) + 1
+    categories = Counter(c.category for c in commits)
     table.add_row("Categories", ", ".join(f"{k}: {v}" for k, v in sorted(categories.items())))
 
     console.print(table)
     console.print(f"\n[green]Saved to {output_path}[/green]")
 
 
+def _analyze_commits(repo_path: Path) -> list:
+    """Analyze one repo's commits (module level, so worker processes can run it)."""
+    from src.analyzers.commit_analyzer import CommitAnalyzer
+
+    return CommitAnalyzer(repo_path).analyze_commits()
+
+
 @app.command()
 def index(
     repos: list[Path] = typer.Argument(..., help="Paths to repositories to index"),
     data_dir: Path = typer.Option("./data", help="Data directory"),
 ):
     """Index repositories for task estimation."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
     from src.estimator.task_estimator import TaskEstimator
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Indexing repositories...", total=len(repos))
 
         estimator = TaskEstimator(chroma_path=str(data_dir / "chroma"))
         total_indexed = 0
 
+        git_repos = []
         for repo_path in repos:
             if not (repo_path / ".git").exists():
                 console.print(f"[yellow]Skipping {repo_path} (not a git repo)[/yellow]")
                 progress.advance(task)
                 continue
-
-            analyzer = CommitAnalyzer(repo_path)
-            commits = analyzer.analyze_commits()
-
-            count = estimator.index_commits(commits, repo_path.name)
-            total_indexed += count
-            progress.advance(task)
+            git_repos.append(repo_path)
+
+        # History walks (git log parsing, categorization) run in worker processes;
+        # embedding and Chroma writes stay here, one repo at a time, as each finishes
+        workers = max(1, min(len(git_repos), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_analyze_commits, repo_path): repo_path for repo_path in git_repos
+            }
+            for future in as_completed(futures):
+                commits = future.result()
+                count = estimator.index_commits(commits, futures[future].name)
+                total_indexed += count
+                progress.advance(task)
 
     console.print(f"\n[green]Indexed {total_indexed} commits from {len(repos)} repos[/green]")
 
@@ -118,13 +136,11 @@ def estimate(
         console.print("Example: export OPENROUTER_API_KEY=your-key")
         raise typer.Exit(1)
 
+    from rich.table import Table
+
     from src.estimator.task_estimator import TaskEstimator
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         progress.add_task("Analyzing task...", total=None)
 
         estimator = TaskEstimator(chroma_path=str(data_dir / "chroma"))
@@ -156,10 +172,9 @@ def estimate(
 
     # Risk
     risk_color = "green" if result.risk_score <= 30 else "yellow" if result.risk_score <= 60 else "red"
-    risk_factors = "\n".join(f"  - {f}" for f in result.risk_factors) if result.risk_factors else "  None identified"
     console.print(
         Panel(
-            f"[bold {risk_color}]{result.risk_score:.0f}/100[/bold {risk_color}]\n{risk_factors}",
+            f"[bold {risk_color}]{result.risk_score:.0f}/100[/bold {risk_color}]\n{result.format_risk_factors(bullet='-')}",
             title="Risk Assessment",
             border_style=risk_color,
         )
@@ -184,8 +199,7 @@ def estimate(
 
     # Recommendations
     if result.recommendations:
-        recs = "\n".join(f"  {i+1}. {r}" for i, r in enumerate(result.recommendations))
-        console.print(Panel(recs, title="Recommendations", border_style="blue"))
+        console.print(Panel(result.format_recommendations(), title="Recommendations", border_style="blue"))
 
 
 @app.command()
@@ -199,13 +213,11 @@ def review(
         console.print("Example: export OPENROUTER_API_KEY=your-key")
         raise typer.Exit(1)
 
+    from rich.table import Table
+
     from src.reviewer.code_reviewer import CodeReviewer
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         progress.add_task("Reviewing code...", total=None)
 
         reviewer = CodeReviewer()
@@ -262,11 +274,11 @@ def metrics(
     repo_path: Path = typer.Argument(..., help="Path to repository"),
 ):
     """Show code metrics for a repository."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    from rich.table import Table
+
+    from src.analyzers.code_analyzer import CodeAnalyzer
+
+    with _spinner() as progress:
         progress.add_task("Analyzing code...", total=None)
 
         analyzer = CodeAnalyzer(repo_path)
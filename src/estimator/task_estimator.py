@@ -2,16 +2,155 @@
 Task estimation using RAG over historical commits + LLM analysis.
 """
 
+import asyncio
+import contextlib
+import functools
 import json
-from dataclasses import dataclass
+import os
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import chromadb
+import numpy as np
 from chromadb.utils import embedding_functions
 
-from src.utils.llm_client import get_llm_client
+from src.utils.llm_client import get_llm_client, parse_json_response
 from src.analyzers.commit_analyzer import CommitData
 
+# Commits per Chroma upsert: large enough to amortize the per-call embedding
+# and HNSW insert overhead, below Chroma's default max batch size (~5461)
+INDEX_BATCH_SIZE = 5000
+
+# Metadata stored with each indexed commit
+COMMIT_METADATA_FIELDS = (
+    "sha",
+    "message",
+    "repo",
+    "category",
+    "files_changed",
+    "insertions",
+    "deletions",
+    "total_churn",
+    "time_since_last",
+    "timestamp",
+)
+
+# Embedded commit documents keep at most this much of the message and only file
+# basenames, so each fits in well under 64 MiniLM tokens (metadata keeps it all)
+EMBED_MESSAGE_CHARS = 200
+
+# Embed with int8-quantized MiniLM weights on CPU (VNNI dot products) instead of
+# FP32. Opt-in: vectors differ slightly, so re-index after switching either way.
+QUANTIZED_EMBEDDINGS = os.environ.get("AEQ_QUANTIZED_EMBEDDINGS") == "1"
+
+# HNSW index for a corpus of hundreds to a few thousand commits. Build params are
+# pinned explicitly (M=16, construction_ef=100) rather than left to Chroma's
+# defaults; search_ef is raised from 10 to 40 so top-5 recall holds, which costs
+# microseconds at this size. MiniLM embeddings are normalized, so cosine is the
+# natural space. Build params only apply when the collection is created.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 40,
+}
+
+# Distinct task descriptions whose query vectors are kept per estimator
+QUERY_EMBEDDING_CACHE_SIZE = 512
+
+# Up to this many indexed commits, queries scan every vector exactly in memory
+# (one matrix-vector product) instead of going through Chroma's HNSW index
+FLAT_SEARCH_MAX_VECTORS = 100_000
+
+# Recent estimates kept for reuse, and how close (cosine) a new task must be to
+# one of them to skip the LLM call
+ESTIMATE_CACHE_SIZE = 256
+ESTIMATE_CACHE_MIN_SIMILARITY = 0.95
+
+# A task at least this similar (cosine) to an indexed commit is estimated from
+# the similar commits' hours alone, without an LLM call
+HISTORY_ONLY_MIN_SIMILARITY = 0.90
+
+# Structured-output schema for the LLM's estimate, so replies are bare, valid JSON
+ESTIMATE_SCHEMA = {
+    "title": "task_estimate",
+    "type": "object",
+    "properties": {
+        "estimated_hours_low": {"type": "number"},
+        "estimated_hours_high": {"type": "number"},
+        "confidence": {"type": "number"},
+        "complexity_score": {"type": "integer"},
+        "complexity_reasoning": {"type": "string"},
+        "risk_score": {"type": "number"},
+        "risk_factors": {"type": "array", "items": {"type": "string"}},
+        "recommendations": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "estimated_hours_low",
+        "estimated_hours_high",
+        "confidence",
+        "complexity_score",
+        "complexity_reasoning",
+        "risk_score",
+        "risk_factors",
+        "recommendations",
+    ],
+    "additionalProperties": False,
+}
+
+# LLM requests in flight at once for batch estimation (provider rate limits)
+MAX_CONCURRENT_ESTIMATES = 8
+
+
+class _QuantizedMiniLM(embedding_functions.ONNXMiniLM_L6_V2):
+    """all-MiniLM-L6-v2 run from a dynamically int8-quantized copy of the ONNX model.
+
+    The quantized file is written next to Chroma's downloaded model on first use.
+    """
+
+    def _init_model_and_tokenizer(self) -> None:
+        """Load the tokenizer and session as usual, then swap in the int8 model."""
+        first_load = self.model is None
+        super()._init_model_and_tokenizer()
+        if not first_load:
+            return
+
+        import onnxruntime
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        model_dir = Path(self.DOWNLOAD_PATH) / self.EXTRACTED_FOLDER_NAME
+        int8_path = model_dir / "model.int8.onnx"
+        if not int8_path.exists():
+            quantize_dynamic(model_dir / "model.onnx", int8_path, weight_type=QuantType.QInt8)
+        self.model = onnxruntime.InferenceSession(
+            str(int8_path), providers=["CPUExecutionProvider"]
+        )
+
+
+@functools.cache
+def _embedding_function():
+    """MiniLM (all-MiniLM-L6-v2) embedder, run on the GPU when onnxruntime has CUDA.
+
+    Shared by every estimator in the process, so the ONNX model is loaded and
+    its runtime session created only once.
+    """
+    if QUANTIZED_EMBEDDINGS:
+        return _QuantizedMiniLM()
+
+    try:
+        import onnxruntime
+
+        providers = onnxruntime.get_available_providers()
+    except ImportError:
+        providers = []
+
+    if "CUDAExecutionProvider" in providers:
+        return embedding_functions.ONNXMiniLM_L6_V2(
+            preferred_providers=["CUDAExecutionProvider", "CPUExecutionProvider"]
+        )
+    return embedding_functions.DefaultEmbeddingFunction()
+
 
 @dataclass
 class TaskEstimate:
@@ -38,6 +177,19 @@ class TaskEstimate:
     # Recommendations
     recommendations: list[str]
 
+    def format_risk_factors(self, limit: int | None = None, bullet: str = "•") -> str:
+        """Indented bullet list of risk factors for display."""
+        if not self.risk_factors:
+            return "  None identified"
+        prefix = "  " + bullet + " "
+        return "\n".join([prefix + f for f in self.risk_factors[:limit]])
+
+    def format_recommendations(self, limit: int | None = None) -> str:
+        """Indented numbered list of recommendations for display."""
+        return "\n".join(
+            ["  %d. %s" % (i, r) for i, r in enumerate(self.recommendations[:limit], 1)]
+        )
+
     def to_dict(self) -> dict:
         return {
             "task_description": self.task_description,
@@ -69,90 +221,228 @@ class TaskEstimator:
         # Initialize ChromaDB with default embedding function
         self.chroma_client = chromadb.PersistentClient(path=str(self.chroma_path))
 
-        # Use default embedding function (all-MiniLM-L6-v2)
-        self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+        # Default embedding model (all-MiniLM-L6-v2), batched per upsert
+        self.embedding_fn = _embedding_function()
 
         self.collection = self.chroma_client.get_or_create_collection(
             name="commits",
             embedding_function=self.embedding_fn,
-            metadata={"hnsw:space": "cosine"},
+            metadata=HNSW_METADATA,
+        )
+
+        # Exact-search copy of the indexed vectors, loaded on first query
+        self._flat_index: tuple[np.ndarray, list[dict]] | None = None
+
+        # Recent estimates and their unit query vectors (one row each), as a FIFO ring
+        self._estimate_vectors: np.ndarray | None = None
+        self._cached_estimates: list[TaskEstimate] = []
+        self._estimate_cache_next = 0
+        self._estimate_cache_lock = threading.Lock()
+
+        # Per-instance LRU of query vectors keyed by normalized task text
+        self._cached_query_embedding = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+            self._query_embedding
         )
 
+    def _query_embedding(self, normalized_text: str):
+        """Embed one query text (uncached)."""
+        return self.embedding_fn([normalized_text])[0]
+
+    def embed_query(self, text: str):
+        """Embedding of a task description, reused for repeated queries.
+
+        MiniLM's tokenizer is uncased and ignores extra whitespace, so
+        lowercasing and collapsing whitespace do not change the vector.
+        """
+        return self._cached_query_embedding(" ".join(text.lower().split()))
+
     def _get_llm(self):
         """Lazy load LLM client."""
         if self.llm is None:
             self.llm = get_llm_client()
         return self.llm
 
-    def index_commits(self, commits: list[CommitData], repo_name: str) -> int:
-        """Index commits for RAG retrieval."""
+    def index_commits(
+        self,
+        commits: list[CommitData],
+        repo_name: str,
+        batch_size: int = INDEX_BATCH_SIZE,
+        lock: threading.Lock | None = None,
+    ) -> int:
+        """Index commits for RAG retrieval.
+
+        Documents are embedded and upserted ``batch_size`` at a time, so each
+        call amortizes its overhead over many commits and large repos stay
+        under Chroma's per-request limit. Upserts keep re-runs idempotent.
+
+        Embeddings are computed explicitly before each upsert; if ``lock`` is
+        given, only the Chroma write holds it, so concurrent callers can embed
+        one repo while another is being written.
+        """
         documents = []
         metadatas = []
         ids = []
 
+        # Copying a same-shape dict skips the per-key growth of a fresh literal
+        template = dict.fromkeys(COMMIT_METADATA_FIELDS)
+        template["repo"] = repo_name
+
         for commit in commits:
             # Create rich document for embedding
-            doc = f"""
-            Commit: {commit.message}
-            Category: {commit.category}
-            Files changed: {commit.files_changed}
-            Lines added: {commit.insertions}
-            Lines deleted: {commit.deletions}
-            Files: {', '.join(commit.file_list[:10])}
-            """
-
-            documents.append(doc.strip())
-            metadatas.append(
-                {
-                    "sha": commit.sha,
-                    "message": commit.message,
-                    "repo": repo_name,
-                    "category": commit.category,
-                    "files_changed": commit.files_changed,
-                    "insertions": commit.insertions,
-                    "deletions": commit.deletions,
-                    "total_churn": commit.total_churn,
-                    "time_since_last": commit.time_since_last_commit_hours or 0,
-                    "timestamp": commit.timestamp.isoformat(),
-                }
+            files = ", ".join(path.rpartition("/")[2] for path in commit.file_list[:10])
+            documents.append(
+                f"Commit: {commit.message[:EMBED_MESSAGE_CHARS]}\n"
+                f"Category: {commit.category}\n"
+                f"Files changed: {commit.files_changed}\n"
+                f"Lines added: {commit.insertions}\n"
+                f"Lines deleted: {commit.deletions}\n"
+                f"Files: {files}"
             )
+            meta = template.copy()
+            meta["sha"] = commit.sha
+            meta["message"] = commit.message
+            meta["category"] = commit.category
+            meta["files_changed"] = commit.files_changed
+            meta["insertions"] = commit.insertions
+            meta["deletions"] = commit.deletions
+            meta["total_churn"] = commit.total_churn
+            meta["time_since_last"] = commit.time_since_last_commit_hours or 0
+            meta["timestamp"] = commit.timestamp.isoformat()
+            metadatas.append(meta)
             ids.append(f"{repo_name}_{commit.sha}")
 
-        if documents:
-            self.collection.upsert(documents=documents, metadatas=metadatas, ids=ids)
+        self._flat_index = None  # Reload on the next query
+
+        for start in range(0, len(documents), batch_size):
+            end = start + batch_size
+            embeddings = self.embedding_fn(documents[start:end])
+            with lock or contextlib.nullcontext():
+                self.collection.upsert(
+                    embeddings=embeddings,
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                )
 
         return len(documents)
 
-    def find_similar_commits(self, task_description: str, n_results: int = 5) -> list[dict]:
-        """Find similar past commits using semantic search."""
-        results = self.collection.query(
-            query_texts=[task_description],
-            n_results=n_results,
-        )
-
-        similar = []
-        if results["metadatas"] and results["metadatas"][0]:
-            for i, meta in enumerate(results["metadatas"][0]):
-                distance = results["distances"][0][i] if results["distances"] else 0
-                similar.append(
-                    {
-                        "sha": meta["sha"],
-                        "message": meta["message"],
-                        "repo": meta["repo"],
-                        "category": meta["category"],
-                        "files_changed": meta["files_changed"],
-                        "total_churn": meta["total_churn"],
-                        "time_hours": meta["time_since_last"],
-                        "similarity": 1 - distance,  # Convert distance to similarity
-                    }
+    def warm_up(self) -> None:
+        """Load the embedding model and the search index now, not on the first estimate.
+
+        Long-lived callers keep the estimator afterwards, so later queries skip
+        both loads.
+        """
+        self.embedding_fn(["warm up"])
+        if self._load_flat_index() is None:
+            # Too large for exact search: the first query loads the HNSW graph
+            self.collection.query(query_embeddings=[self.embed_query("warm up")], n_results=1)
+
+    def get_indexed_shas(self, repo_name: str) -> set[str]:
+        """Return the SHAs already indexed for a repository."""
+        existing = self.collection.get(where={"repo": repo_name}, include=["metadatas"])
+        return {meta["sha"] for meta in existing["metadatas"] or []}
+
+    def _load_flat_index(self) -> tuple[np.ndarray, list[dict]] | None:
+        """Every indexed vector (unit rows) and its metadata, for exact search.
+
+        Loaded from Chroma once, a page at a time into one preallocated float32
+        array, and kept until the next ``index_commits``. Returns None when the
+        corpus is too large for brute force.
+        """
+        if self._flat_index is None:
+            count = self.collection.count()
+            if count > FLAT_SEARCH_MAX_VECTORS:
+                return None
+
+            vectors = None
+            metadatas = []
+            for offset in range(0, count, INDEX_BATCH_SIZE):
+                page = self.collection.get(
+                    include=["embeddings", "metadatas"], limit=INDEX_BATCH_SIZE, offset=offset
                 )
+                # Rows added since count() are left for the next reload
+                embeddings = np.asarray(page["embeddings"], dtype=np.float32)[: count - offset]
+                if not len(embeddings):
+                    break
+                if vectors is None:
+                    vectors = np.empty((count, embeddings.shape[1]), dtype=np.float32)
+                vectors[offset : offset + len(embeddings)] = embeddings
+                metadatas.extend(page["metadatas"][: len(embeddings)])
+
+            if vectors is None:
+                vectors = np.empty((0, 0), dtype=np.float32)
+            vectors = vectors[: len(metadatas)]
+            if len(vectors):
+                vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+            self._flat_index = (vectors, metadatas)
+        return self._flat_index
+
+    @staticmethod
+    def _similar_commit(meta: dict, similarity: float) -> dict:
+        return {
+            "sha": meta["sha"],
+            "message": meta["message"],
+            "repo": meta["repo"],
+            "category": meta["category"],
+            "files_changed": meta["files_changed"],
+            "total_churn": meta["total_churn"],
+            "time_hours": meta["time_since_last"],
+            "similarity": similarity,
+        }
 
-        return similar
-
-    def _estimate_with_llm(
+    def find_similar_commits(self, task_description: str, n_results: int = 5) -> list[dict]:
+        """Find similar past commits using semantic search.
+
+        Small corpora are searched exactly with one inner-product scan over the
+        in-memory vectors; larger ones go through Chroma's HNSW index.
+        """
+        query = self._unit_query_vector(task_description)
+        return self._search(query[np.newaxis], n_results)[0]
+
+    def find_similar_commits_batch(
+        self, task_descriptions: list[str], n_results: int = 5
+    ) -> list[list[dict]]:
+        """``find_similar_commits`` for many tasks: one embedding pass and one search."""
+        if not task_descriptions:
+            return []
+        return self._search(self._embed_queries(task_descriptions), n_results)
+
+    def _embed_queries(self, texts: list[str]) -> np.ndarray:
+        """Unit float32 query embeddings (one row each) from a single model call."""
+        vectors = np.asarray(
+            self.embedding_fn([" ".join(text.lower().split()) for text in texts]),
+            dtype=np.float32,
+        )
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+        return vectors
+
+    def _search(self, queries: np.ndarray, n_results: int) -> list[list[dict]]:
+        """Top ``n_results`` similar commits for each row of unit query vectors."""
+        flat = self._load_flat_index()
+        if flat is not None:
+            vectors, metadatas = flat
+            if not len(vectors):
+                return [[] for _ in queries]
+            sims = queries @ vectors.T  # cosine similarity, as with the cosine HNSW space
+            k = min(n_results, len(vectors))
+            tops = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            similar = []
+            for row, top in zip(sims, tops):
+                top = top[np.argsort(-row[top])]
+                similar.append([self._similar_commit(metadatas[i], float(row[i])) for i in top])
+            return similar
+
+        results = self.collection.query(query_embeddings=queries.tolist(), n_results=n_results)
+        # Convert distance to similarity
+        return [
+            [self._similar_commit(meta, 1 - distance) for meta, distance in zip(metas, distances)]
+            for metas, distances in zip(results["metadatas"], results["distances"])
+        ]
+
+    def _build_estimate_prompt(
         self, task_description: str, similar_commits: list[dict], codebase_context: str = ""
-    ) -> dict:
-        """Use LLM to estimate task complexity and time."""
+    ) -> str:
+        """Build the estimation prompt for a task and its similar past work."""
 
         similar_context = "\n".join(
             [
@@ -194,43 +484,207 @@ Consider:
 
 Return ONLY the JSON, no other text."""
 
-        llm = self._get_llm()
-        content = llm.complete(prompt, max_tokens=1024, temperature=0.3)
+        return prompt
 
+    def _parse_estimate(self, content: str) -> dict:
+        """Parse the LLM's JSON estimate, falling back to wide defaults.
+
+        Replies are normally schema-constrained JSON, but a provider that ignores
+        the schema may wrap it in a ```json fence, which is accepted too.
+        """
         try:
-            # Extract JSON from response
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            return json.loads(content.strip())
-        except (json.JSONDecodeError, IndexError):
-            # Fallback estimates
-            return {
-                "estimated_hours_low": 2,
-                "estimated_hours_high": 8,
-                "confidence": 0.3,
-                "complexity_score": 5,
-                "complexity_reasoning": "Unable to parse LLM response",
-                "risk_score": 50,
-                "risk_factors": ["Estimation uncertainty"],
-                "recommendations": ["Break down task into smaller pieces"],
-            }
+            return parse_json_response(content)
+        except (json.JSONDecodeError, TypeError, AttributeError):  # Not JSON, or no content
+            pass
+
+        # Fallback estimates
+        return {
+            "estimated_hours_low": 2,
+            "estimated_hours_high": 8,
+            "confidence": 0.3,
+            "complexity_score": 5,
+            "complexity_reasoning": "Unable to parse LLM response",
+            "risk_score": 50,
+            "risk_factors": ["Estimation uncertainty"],
+            "recommendations": ["Break down task into smaller pieces"],
+        }
+
+    def _estimate_with_llm(
+        self, task_description: str, similar_commits: list[dict], codebase_context: str = ""
+    ) -> dict:
+        """Use LLM to estimate task complexity and time."""
+        prompt = self._build_estimate_prompt(task_description, similar_commits, codebase_context)
+        content = self._get_llm().complete(
+            prompt, max_tokens=1024, temperature=0.3, json_schema=ESTIMATE_SCHEMA
+        )
+        return self._parse_estimate(content)
+
+    async def _aestimate_with_llm(
+        self, task_description: str, similar_commits: list[dict], codebase_context: str = ""
+    ) -> dict:
+        """Async variant of ``_estimate_with_llm``."""
+        prompt = self._build_estimate_prompt(task_description, similar_commits, codebase_context)
+        content = await self._get_llm().acomplete(
+            prompt, max_tokens=1024, temperature=0.3, json_schema=ESTIMATE_SCHEMA
+        )
+        return self._parse_estimate(content)
+
+    def _lookup_estimate(
+        self, task_description: str, query: np.ndarray | None = None
+    ) -> TaskEstimate | None:
+        """A cached estimate for a near-identical task (cosine >= threshold), if any."""
+        if query is None:
+            query = self._unit_query_vector(task_description)
+        with self._estimate_cache_lock:
+            if not self._cached_estimates:
+                return None
+            sims = self._estimate_vectors[: len(self._cached_estimates)] @ query
+            best = int(np.argmax(sims))
+            if sims[best] < ESTIMATE_CACHE_MIN_SIMILARITY:
+                return None
+            return replace(self._cached_estimates[best], task_description=task_description)
+
+    def _remember_estimate(self, estimate: TaskEstimate, query: np.ndarray | None = None) -> None:
+        """Store an estimate in the fixed-size FIFO ring of recent results."""
+        if query is None:
+            query = self._unit_query_vector(estimate.task_description)
+        with self._estimate_cache_lock:
+            if self._estimate_vectors is None:
+                self._estimate_vectors = np.zeros(
+                    (ESTIMATE_CACHE_SIZE, query.shape[0]), dtype=np.float32
+                )
+            slot = self._estimate_cache_next % ESTIMATE_CACHE_SIZE
+            self._estimate_vectors[slot] = query
+            if slot < len(self._cached_estimates):
+                self._cached_estimates[slot] = estimate
+            else:
+                self._cached_estimates.append(estimate)
+            self._estimate_cache_next += 1
+
+    def _unit_query_vector(self, text: str) -> np.ndarray:
+        """Normalized float32 query embedding, so dot products are cosines."""
+        vector = np.asarray(self.embed_query(text), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
 
     def estimate_task(
-        self, task_description: str, codebase_context: str = ""
+        self, task_description: str, codebase_context: str = "", use_cache: bool = True
     ) -> TaskEstimate:
-        """Estimate a task's difficulty, time, and risk."""
+        """Estimate a task's difficulty, time, and risk.
+
+        With ``use_cache`` (and no ``codebase_context``), a task nearly identical
+        to a recent one reuses that estimate, and one nearly identical to an
+        indexed commit is estimated from history alone; neither calls the LLM.
+        """
+        use_cache = use_cache and not codebase_context
+        if use_cache and (cached := self._lookup_estimate(task_description)):
+            return cached
 
         # Find similar past work
         similar_commits = self.find_similar_commits(task_description, n_results=5)
 
-        # Get LLM estimate
-        llm_result = self._estimate_with_llm(
-            task_description, similar_commits, codebase_context
+        estimate = (
+            self._estimate_from_history(task_description, similar_commits) if use_cache else None
+        )
+        if estimate is None:
+            # Get LLM estimate
+            llm_result = self._estimate_with_llm(
+                task_description, similar_commits, codebase_context
+            )
+            estimate = self._build_estimate(task_description, similar_commits, llm_result)
+        if use_cache:
+            self._remember_estimate(estimate)
+        return estimate
+
+    async def aestimate_task(
+        self, task_description: str, codebase_context: str = "", use_cache: bool = True
+    ) -> TaskEstimate:
+        """Async ``estimate_task``: the LLM call does not block the event loop."""
+        use_cache = use_cache and not codebase_context
+        if use_cache:
+            cached = await asyncio.to_thread(self._lookup_estimate, task_description)
+            if cached:
+                return cached
+
+        # Chroma is synchronous; run the lookup off the loop
+        similar_commits = await asyncio.to_thread(
+            self.find_similar_commits, task_description, 5
+        )
+        estimate = (
+            self._estimate_from_history(task_description, similar_commits) if use_cache else None
+        )
+        if estimate is None:
+            llm_result = await self._aestimate_with_llm(
+                task_description, similar_commits, codebase_context
+            )
+            estimate = self._build_estimate(task_description, similar_commits, llm_result)
+        if use_cache:
+            self._remember_estimate(estimate)
+        return estimate
+
+    async def aestimate_tasks(
+        self, tasks: list[str], max_concurrency: int = MAX_CONCURRENT_ESTIMATES
+    ) -> list[TaskEstimate]:
+        """Estimate many tasks concurrently, in order, with bounded requests in flight.
+
+        All tasks are embedded in one model call and searched together up front;
+        only the LLM requests run per task.
+        """
+        if not tasks:
+            return []
+        self._get_llm()  # One shared client for every request
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        queries = await asyncio.to_thread(self._embed_queries, tasks)
+        similar = await asyncio.to_thread(self._search, queries, 5)
+
+        async def estimate(
+            task: str, query: np.ndarray, similar_commits: list[dict]
+        ) -> TaskEstimate:
+            async with semaphore:
+                if cached := self._lookup_estimate(task, query):
+                    return cached
+                estimate = self._estimate_from_history(task, similar_commits)
+                if estimate is None:
+                    llm_result = await self._aestimate_with_llm(task, similar_commits)
+                    estimate = self._build_estimate(task, similar_commits, llm_result)
+            self._remember_estimate(estimate, query)
+            return estimate
+
+        return await asyncio.gather(*(estimate(*args) for args in zip(tasks, queries, similar)))
+
+    def _estimate_from_history(
+        self, task_description: str, similar_commits: list[dict]
+    ) -> TaskEstimate | None:
+        """Estimate straight from past commits when the top match is near-identical.
+
+        Hours span the interquartile range of the similar commits' times; the
+        other scores keep their neutral defaults. None if no match is close enough.
+        """
+        if not similar_commits or similar_commits[0]["similarity"] < HISTORY_ONLY_MIN_SIMILARITY:
+            return None
+
+        top = similar_commits[0]
+        low, high = np.percentile([c["time_hours"] for c in similar_commits], [25, 75])
+        return TaskEstimate(
+            task_description=task_description,
+            estimated_hours_low=float(low),
+            estimated_hours_high=float(high),
+            confidence=top["similarity"],
+            complexity_score=5,
+            complexity_reasoning=(
+                f"Derived from {len(similar_commits)} similar past commits "
+                f"(closest {top['similarity']:.0%} similar)"
+            ),
+            risk_score=50,
+            risk_factors=[],
+            similar_commits=similar_commits,
+            recommendations=[f"Follow the approach of {top['sha']}: {top['message']}"],
         )
 
+    def _build_estimate(
+        self, task_description: str, similar_commits: list[dict], llm_result: dict
+    ) -> TaskEstimate:
+        """Assemble a TaskEstimate from the parsed LLM result."""
         return TaskEstimate(
             task_description=task_description,
             estimated_hours_low=llm_result.get("estimated_hours_low", 2),
@@ -2,15 +2,165 @@
 AI-powered code review with risk scoring.
 """
 
+import asyncio
+import hashlib
 import json
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
-from src.utils.llm_client import get_llm_client
+import orjson
+
+from src.utils.json_stream import JsonObjectStream
+from src.utils.llm_client import get_llm_client, parse_json_response
 from src.analyzers.code_analyzer import CodeAnalyzer, CodeMetrics
 
+# LLM requests in flight at once for batch review (provider rate limits)
+MAX_CONCURRENT_REVIEWS = 8
+
+# Head of the git diff sent for review
+MAX_DIFF_SIZE = 10_000
+
+# Code tokens of a single file sent for review; the file is cut at this budget
+MAX_FILE_TOKENS = 6000
+
+# Bytes read per token of budget before counting; generous so the token cut, not
+# the byte cap, decides where ordinary source files are truncated
+_BYTES_PER_TOKEN = 8
+
+# Code tokens packed into one request by review_files_batched
+REVIEW_BATCH_TOKENS = 12_000
+
+# Parsed reviews keyed by a hash of model, prompt version and full prompt, so an
+# unchanged file or diff is not sent to the LLM again
+REVIEW_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "review_cache"
+
+# Bump when the review prompts or response handling change so stale cached reviews are ignored
+PROMPT_VERSION = "v1"
+
+# Returned when the LLM response is not valid JSON (never cached)
+UNPARSED_REVIEW = {
+    "risk_score": 50,
+    "quality_score": 50,
+    "issues": [],
+    "summary": "Unable to parse review",
+    "merge_recommendation": "needs_discussion",
+}
+
+# Returned for a file whose LLM request still failed after the client's retries
+# (never cached), so one bad request does not fail a whole batch or review
+FAILED_REVIEW = {**UNPARSED_REVIEW, "summary": "LLM review request failed"}
+
+# Review prompt skeletons; only the $-slots are filled per call
+_FILE_REVIEW_PROMPT = string.Template("""You are an expert code reviewer. Review this code and identify issues.
+
+## File: $file_path
+$metrics_context
+
+## Code
+```
+$code_content
+```
+
+## Review Instructions
+1. Check for security vulnerabilities (injection, auth issues, secrets)
+2. Check for bugs and logic errors
+3. Check for performance issues
+4. Check for maintainability problems
+5. Check for missing error handling
 
-@dataclass
+Provide your review in this JSON format:
+{
+    "risk_score": <0-100>,
+    "quality_score": <0-100>,
+    "issues": [
+        {
+            "severity": "<critical|warning|suggestion>",
+            "category": "<security|performance|maintainability|bug|style>",
+            "line": <line_number or null>,
+            "message": "<description of issue>",
+            "suggestion": "<how to fix>"
+        }
+    ],
+    "summary": "<1-2 sentence summary>",
+    "merge_recommendation": "<approve|request_changes|needs_discussion>"
+}
+
+Focus on meaningful issues, not style nitpicks. Return ONLY valid JSON.""")
+
+_DIFF_REVIEW_PROMPT = string.Template("""You are an expert code reviewer. Review this git diff and identify issues.
+
+## Git Diff
+```diff
+$diff
+```
+
+## Review Instructions
+1. Check for security vulnerabilities
+2. Check for bugs and logic errors
+3. Check for breaking changes
+4. Check for missing error handling
+5. Consider the impact of these changes
+
+Provide your review in this JSON format:
+{
+    "risk_score": <0-100>,
+    "quality_score": <0-100>,
+    "issues": [
+        {
+            "severity": "<critical|warning|suggestion>",
+            "category": "<security|performance|maintainability|bug|style>",
+            "file": "<filename>",
+            "line": <line_number or null>,
+            "message": "<description of issue>",
+            "suggestion": "<how to fix>"
+        }
+    ],
+    "summary": "<1-2 sentence summary of the changes and their quality>",
+    "merge_recommendation": "<approve|request_changes|needs_discussion>"
+}
+
+Return ONLY valid JSON.""")
+
+_BATCH_REVIEW_PROMPT = string.Template("""You are an expert code reviewer. Review each of these $count files and identify issues.
+
+$files
+## Review Instructions
+1. Check for security vulnerabilities (injection, auth issues, secrets)
+2. Check for bugs and logic errors
+3. Check for performance issues
+4. Check for maintainability problems
+5. Check for missing error handling
+
+Review every file separately and provide the reviews in this JSON format:
+{
+    "files": [
+        {
+            "path": "<file path exactly as given>",
+            "risk_score": <0-100>,
+            "quality_score": <0-100>,
+            "issues": [
+                {
+                    "severity": "<critical|warning|suggestion>",
+                    "category": "<security|performance|maintainability|bug|style>",
+                    "line": <line_number or null>,
+                    "message": "<description of issue>",
+                    "suggestion": "<how to fix>"
+                }
+            ],
+            "summary": "<1-2 sentence summary>",
+            "merge_recommendation": "<approve|request_changes|needs_discussion>"
+        }
+    ]
+}
+
+Focus on meaningful issues, not style nitpicks. Return ONLY valid JSON.""")
+
+
+@dataclass(slots=True)
 class ReviewIssue:
     """A single issue found during code review."""
 
@@ -22,7 +172,7 @@ class ReviewIssue:
     suggestion: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Complete review result for code changes."""
 
@@ -60,12 +210,18 @@ class ReviewResult:
             "static_metrics": self.static_metrics,
         }
 
+    def to_json(self) -> bytes:
+        """``to_dict`` serialized with orjson, as UTF-8 bytes ready to write."""
+        return orjson.dumps(self.to_dict())
+
 
 class CodeReviewer:
     """Reviews code changes using static analysis + LLM."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Path | None = REVIEW_CACHE_DIR):
         self.llm = None  # Lazy load
+        self.cache_dir = cache_dir  # None disables the review cache
+        self._analyzers: dict[Path, CodeAnalyzer] = {}  # By directory, reused across files
 
     def _get_llm(self):
         """Lazy load LLM client."""
@@ -73,64 +229,115 @@ class CodeReviewer:
             self.llm = get_llm_client()
         return self.llm
 
-    def _read_file_content(self, file_path: Path, max_lines: int = 500) -> str:
-        """Read file content with line limit."""
+    def _get_analyzer(self, directory: Path) -> CodeAnalyzer:
+        """The CodeAnalyzer for a directory, created on first use."""
+        analyzer = self._analyzers.get(directory)
+        if analyzer is None:
+            analyzer = self._analyzers[directory] = CodeAnalyzer(directory)
+        return analyzer
+
+    @staticmethod
+    def _read_file_content(file_path: Path, max_tokens: int = MAX_FILE_TOKENS) -> str:
+        """Read the head of a file that fits in ``max_tokens`` prompt tokens.
+
+        Tokens are counted with tiktoken when installed. Only a bounded head of
+        the file is decoded; the rest is just scanned in fixed-size chunks to
+        count how many lines were cut.
+        """
+        from src.utils.diff import truncate_tokens
+
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.split("\n")
-            if len(lines) > max_lines:
-                lines = lines[:max_lines]
-                lines.append(f"\n... truncated ({len(lines)} more lines)")
-            return "\n".join(lines)
+            with file_path.open("rb") as f:
+                raw = f.read(max_tokens * _BYTES_PER_TOKEN)
+                last = raw[-1:]
+                rest_lines = 0
+                cut = False
+                while chunk := f.read(1 << 16):
+                    rest_lines += chunk.count(b"\n")
+                    last = chunk[-1:]
+                    cut = True
+
+            text = raw.decode("utf-8", errors="ignore")
+            content = truncate_tokens(text, max_tokens)
+            if cut or len(content) < len(text):
+                more_lines = text.count("\n", len(content)) + rest_lines
+                if last not in (b"", b"\n"):
+                    more_lines += 1  # Final line without a trailing newline
+                if more_lines:
+                    content += f"\n... truncated ({more_lines} more lines)"
+            return content
         except Exception as e:
             return f"Error reading file: {e}"
 
     def _get_git_diff(self, repo_path: Path) -> str:
-        """Get the current git diff."""
+        """Get the current git diff: staged, else unstaged, else against HEAD~1.
+
+        Uses pygit2 when installed, reading the object database in-process
+        instead of spawning up to three git commands.
+        """
+        try:
+            import pygit2
+        except ImportError:  # pygit2 is optional
+            return self._get_git_diff_subprocess(repo_path)
+
+        from src.utils.diff import decode_diff
+
+        try:
+            repo = pygit2.Repository(str(repo_path))
+
+            # Staged, then unstaged, then the working tree against HEAD~1
+            diff = repo.diff("HEAD", cached=True).patch or ""
+            if not diff.strip():
+                diff = repo.diff().patch or ""
+            if not diff.strip():
+                parent_tree = repo.revparse_single("HEAD~1").peel(pygit2.Tree)
+                diff = parent_tree.diff_to_workdir().patch or ""
+
+            # Same filtering and byte budget as the git CLI path
+            return decode_diff(diff.encode(), max_bytes=MAX_DIFF_SIZE)
+
+        except Exception as e:
+            return f"Error getting diff: {e}"
+
+    def _get_git_diff_subprocess(self, repo_path: Path) -> str:
+        """``_get_git_diff`` via the git CLI.
+
+        One ``git status`` call decides which diff to run, so a clean tree
+        costs two git commands instead of three. Output is kept as bytes and
+        only the reviewed head is decoded.
+        """
         import subprocess
 
+        from src.utils.diff import decode_diff
+
         try:
-            # Get staged diff
-            result = subprocess.run(
-                ["git", "diff", "--cached"],
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
                 cwd=repo_path,
                 capture_output=True,
-                text=True,
             )
-            diff = result.stdout
+            if status.returncode != 0:
+                return ""  # Not a git work tree: nothing to review
 
-            # If no staged changes, get unstaged diff
-            if not diff.strip():
-                result = subprocess.run(
-                    ["git", "diff"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                )
-                diff = result.stdout
-
-            # If still no diff, get diff from last commit
-            if not diff.strip():
-                result = subprocess.run(
-                    ["git", "diff", "HEAD~1"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                )
-                diff = result.stdout
+            # Porcelain lines are "XY path": X is the index, Y the work tree
+            changes = status.stdout.splitlines()
+            if any(line[:1] != b" " for line in changes):
+                args = ["git", "diff", "--cached"]  # Staged changes
+            elif changes:
+                args = ["git", "diff"]  # Unstaged changes only
+            else:
+                args = ["git", "diff", "HEAD~1"]  # Clean tree: the last commit
 
-            return diff[:10000]  # Limit diff size
+            result = subprocess.run(args, cwd=repo_path, capture_output=True)
+            return decode_diff(result.stdout, max_bytes=MAX_DIFF_SIZE)  # Limit diff size
 
         except Exception as e:
             return f"Error getting diff: {e}"
 
-    def _review_with_llm(
-        self,
-        code_content: str,
-        file_path: str,
-        static_metrics: CodeMetrics | None,
-    ) -> dict:
-        """Use LLM to review code."""
+    def _build_review_prompt(
+        self, code_content: str, file_path: str, static_metrics: CodeMetrics | None
+    ) -> str:
+        """Build the review prompt for one file."""
 
         metrics_context = ""
         if static_metrics:
@@ -141,82 +348,273 @@ class CodeReviewer:
 - Risk Score: {static_metrics.risk_score:.0f}/100
 """
 
-        prompt = f"""You are an expert code reviewer. Review this code and identify issues.
-
-## File: {file_path}
-{metrics_context}
-
-## Code
-```
-{code_content}
-```
+        prompt = _FILE_REVIEW_PROMPT.substitute(
+            file_path=file_path, metrics_context=metrics_context, code_content=code_content
+        )
 
-## Review Instructions
-1. Check for security vulnerabilities (injection, auth issues, secrets)
-2. Check for bugs and logic errors
-3. Check for performance issues
-4. Check for maintainability problems
-5. Check for missing error handling
+        return prompt
 
-Provide your review in this JSON format:
-{{
-    "risk_score": <0-100>,
-    "quality_score": <0-100>,
-    "issues": [
-        {{
-            "severity": "<critical|warning|suggestion>",
-            "category": "<security|performance|maintainability|bug|style>",
-            "line": <line_number or null>,
-            "message": "<description of issue>",
-            "suggestion": "<how to fix>"
-        }}
-    ],
-    "summary": "<1-2 sentence summary>",
-    "merge_recommendation": "<approve|request_changes|needs_discussion>"
-}}
+    def _review_with_llm(
+        self,
+        code_content: str,
+        file_path: str,
+        static_metrics: CodeMetrics | None,
+        on_issue: Callable[[ReviewIssue], None] | None = None,
+    ) -> dict:
+        """Use LLM to review code."""
+        prompt = self._build_review_prompt(code_content, file_path, static_metrics)
+        return self._stream_review(prompt, file_path, on_issue)
 
-Focus on meaningful issues, not style nitpicks. Return ONLY valid JSON."""
+    def _stream_review(
+        self,
+        prompt: str,
+        file_path: str | None,
+        on_issue: Callable[[ReviewIssue], None] | None,
+    ) -> dict:
+        """Stream the LLM review, passing each issue to ``on_issue`` as soon as it is complete.
+
+        A review cached for the same prompt and model is returned without a request.
+        """
+        key = self._review_cache_key(prompt)
+        cached = self._load_cached_review(key)
+        if cached is not None:
+            if on_issue:
+                for raw_issue in cached.get("issues", []):
+                    on_issue(self._to_issue(raw_issue, file_path))
+            return cached
 
         llm = self._get_llm()
-        content = llm.complete(prompt, max_tokens=2048, temperature=0.2)
-
+        parser = JsonObjectStream()
+        try:
+            for chunk in llm.complete_stream(prompt, max_tokens=2048, temperature=0.2):
+                for raw_issue in parser.feed(chunk):
+                    if on_issue and isinstance(raw_issue, dict):
+                        on_issue(self._to_issue(raw_issue, file_path))
+        except llm.request_errors:
+            return dict(FAILED_REVIEW)
+
+        return self._finish_review(key, parser.text)
+
+    def _review_cache_key(self, prompt: str) -> str:
+        """Hash the inputs that determine the LLM review."""
+        return hashlib.blake2b(
+            f"{self._get_llm().model}\0{PROMPT_VERSION}\0{prompt}".encode()
+        ).hexdigest()
+
+    def _load_cached_review(self, key: str) -> dict | None:
+        """Return a previously parsed LLM review, if any."""
+        if self.cache_dir is None:
+            return None
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            return orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _finish_review(self, key: str, content: str) -> dict:
+        """Parse a review response, caching it if it parsed, else a neutral fallback."""
+        llm_result = self._parse_review(content)
+        if llm_result is None:
+            return dict(UNPARSED_REVIEW)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_bytes(orjson.dumps(llm_result))
+        return llm_result
+
+    @staticmethod
+    def _parse_review(content: str) -> dict | None:
+        """Parse the LLM's JSON review; None if it is not valid JSON."""
         try:
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            return json.loads(content.strip())
-        except (json.JSONDecodeError, IndexError):
-            return {
-                "risk_score": 50,
-                "quality_score": 50,
-                "issues": [],
-                "summary": "Unable to parse review",
-                "merge_recommendation": "needs_discussion",
-            }
-
-    def review_file(self, file_path: Path) -> ReviewResult:
-        """Review a single file."""
+            return parse_json_response(content)
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _to_issue(raw: dict, file_path: str | None) -> ReviewIssue:
+        """A ReviewIssue from one LLM issue object; ``file_path`` None takes the issue's own."""
+        return ReviewIssue(
+            severity=raw.get("severity", "suggestion"),
+            category=raw.get("category", "maintainability"),
+            file=file_path if file_path is not None else raw.get("file", "unknown"),
+            line=raw.get("line"),
+            message=raw.get("message", ""),
+            suggestion=raw.get("suggestion"),
+        )
+
+    def review_file(
+        self, file_path: Path, on_issue: Callable[[ReviewIssue], None] | None = None
+    ) -> ReviewResult:
+        """Review a single file.
+
+        The LLM response is streamed; ``on_issue`` (if given) receives each issue
+        as soon as it has been generated, before the full result is ready.
+        """
         content = self._read_file_content(file_path)
 
         # Get static analysis metrics
-        analyzer = CodeAnalyzer(file_path.parent)
-        static_metrics = analyzer.analyze_file(file_path)
+        static_metrics = self._get_analyzer(file_path.parent).analyze_file(file_path)
 
         # Get LLM review
-        llm_result = self._review_with_llm(content, str(file_path), static_metrics)
-
-        issues = [
-            ReviewIssue(
-                severity=i.get("severity", "suggestion"),
-                category=i.get("category", "maintainability"),
-                file=str(file_path),
-                line=i.get("line"),
-                message=i.get("message", ""),
-                suggestion=i.get("suggestion"),
+        llm_result = self._review_with_llm(content, str(file_path), static_metrics, on_issue)
+
+        return self._file_result(file_path, llm_result, static_metrics)
+
+    async def areview_file(self, file_path: Path) -> ReviewResult:
+        """Async ``review_file``: file reads and analysis run off the event loop."""
+        content, static_metrics = await asyncio.to_thread(
+            _read_and_analyze, file_path, self._get_analyzer(file_path.parent)
+        )
+        return await self._areview_analyzed(file_path, content, static_metrics)
+
+    async def _areview_analyzed(
+        self, file_path: Path, content: str, static_metrics: CodeMetrics
+    ) -> ReviewResult:
+        """LLM half of ``areview_file`` for an already read and analyzed file."""
+        prompt = self._build_review_prompt(content, str(file_path), static_metrics)
+        key = self._review_cache_key(prompt)
+        llm_result = self._load_cached_review(key)
+        if llm_result is None:
+            llm = self._get_llm()
+            try:
+                response = await llm.acomplete(prompt, max_tokens=2048, temperature=0.2)
+            except llm.request_errors:
+                llm_result = dict(FAILED_REVIEW)
+            else:
+                llm_result = self._finish_review(key, response)
+
+        return self._file_result(file_path, llm_result, static_metrics)
+
+    async def review_files(
+        self, file_paths: list[Path], max_concurrency: int = MAX_CONCURRENT_REVIEWS
+    ) -> list[ReviewResult]:
+        """Review many files concurrently, in order, with bounded requests in flight."""
+        self._get_llm()  # One shared client for every request
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def review(file_path: Path) -> ReviewResult:
+            async with semaphore:
+                return await self.areview_file(file_path)
+
+        return await asyncio.gather(*(review(path) for path in file_paths))
+
+    async def review_many(
+        self,
+        file_paths: list[Path],
+        workers: int | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REVIEWS,
+    ) -> list[ReviewResult]:
+        """Like ``review_files``, but reading and static analysis run in worker processes.
+
+        Radon's parsing is CPU-bound and holds the GIL, so for large file sets
+        it is spread over ``workers`` processes (default: one per CPU) before
+        the LLM requests are dispatched. Each worker builds one CodeAnalyzer
+        and reuses it for every file it is given.
+        """
+        if not file_paths:
+            return []
+
+        root = Path(os.path.commonpath([path.absolute().parent for path in file_paths]))
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_review_worker, initargs=(root,)
+        ) as pool:
+            analyzed = await asyncio.gather(
+                *(loop.run_in_executor(pool, _read_and_analyze, path) for path in file_paths)
             )
-            for i in llm_result.get("issues", [])
+
+        self._get_llm()  # One shared client for every request
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def review(file_path: Path, content: str, metrics: CodeMetrics) -> ReviewResult:
+            async with semaphore:
+                return await self._areview_analyzed(file_path, content, metrics)
+
+        return await asyncio.gather(
+            *(review(path, *result) for path, result in zip(file_paths, analyzed))
+        )
+
+    def review_files_batched(
+        self, file_paths: list[Path], batch_tokens: int = REVIEW_BATCH_TOKENS
+    ) -> list[ReviewResult]:
+        """Review many files, packing small ones into shared LLM requests.
+
+        Files are grouped greedily, in order, up to ``batch_tokens`` of code per
+        request, so the instructions and round-trip are paid once per batch.
+        A batch holding a single file goes through ``review_file``.
+        """
+        from src.utils.diff import count_tokens
+
+        batches = []
+        batch = []
+        used = 0
+        for file_path in file_paths:
+            content = self._read_file_content(file_path)
+            tokens = count_tokens(content)
+            if batch and used + tokens > batch_tokens:
+                batches.append(batch)
+                batch = []
+                used = 0
+            batch.append((file_path, content))
+            used += tokens
+        if batch:
+            batches.append(batch)
+
+        results = []
+        for batch in batches:
+            if len(batch) == 1:
+                results.append(self.review_file(batch[0][0]))
+            else:
+                results.extend(self._review_batch(batch))
+        return results
+
+    def _review_batch(self, batch: list[tuple[Path, str]]) -> list[ReviewResult]:
+        """Review several files with one LLM request and fan the answer out per file."""
+        static_metrics = [
+            self._get_analyzer(file_path.parent).analyze_file(file_path) for file_path, _ in batch
         ]
+        prompt = self._build_batch_prompt(batch, static_metrics)
+
+        key = self._review_cache_key(prompt)
+        llm_result = self._load_cached_review(key)
+        fallback = UNPARSED_REVIEW
+        if llm_result is None:
+            llm = self._get_llm()
+            try:
+                content = llm.complete(prompt, max_tokens=4096, temperature=0.2)
+            except llm.request_errors:
+                llm_result, fallback = {}, FAILED_REVIEW
+            else:
+                llm_result = self._finish_review(key, content)
+
+        by_path = {
+            f.get("path"): f for f in llm_result.get("files", []) if isinstance(f, dict)
+        }
+        return [
+            self._file_result(file_path, by_path.get(str(file_path), fallback), metrics)
+            for (file_path, _), metrics in zip(batch, static_metrics)
+        ]
+
+    def _build_batch_prompt(
+        self, batch: list[tuple[Path, str]], static_metrics: list[CodeMetrics]
+    ) -> str:
+        """Build one review prompt covering every file in ``batch``."""
+        files = "\n".join(
+            f"## FILE {k}: {file_path}\n"
+            f"(complexity {metrics.cyclomatic_complexity:.1f}, {metrics.lines_of_code} LOC, "
+            f"static risk {metrics.risk_score:.0f}/100)\n"
+            f"```\n{content}\n```\n"
+            for k, ((file_path, content), metrics) in enumerate(zip(batch, static_metrics), 1)
+        )
+
+        return _BATCH_REVIEW_PROMPT.substitute(count=len(batch), files=files)
+
+    def _file_result(
+        self, file_path: Path, llm_result: dict, static_metrics: CodeMetrics
+    ) -> ReviewResult:
+        """Assemble a file's ReviewResult from the parsed LLM review and static metrics."""
+        issues = [self._to_issue(i, str(file_path)) for i in llm_result.get("issues", [])]
 
         return ReviewResult(
             risk_score=llm_result.get("risk_score", 50),
@@ -231,8 +629,13 @@ Focus on meaningful issues, not style nitpicks. Return ONLY valid JSON."""
             },
         )
 
-    def review_diff(self, repo_path: Path) -> ReviewResult:
-        """Review current git diff in a repository."""
+    def review_diff(
+        self, repo_path: Path, on_issue: Callable[[ReviewIssue], None] | None = None
+    ) -> ReviewResult:
+        """Review current git diff in a repository.
+
+        Issues are streamed to ``on_issue`` as in ``review_file``.
+        """
         diff = self._get_git_diff(repo_path)
 
         if not diff.strip() or "Error" in diff:
@@ -246,69 +649,11 @@ Focus on meaningful issues, not style nitpicks. Return ONLY valid JSON."""
             )
 
         # Review the diff content
-        prompt = f"""You are an expert code reviewer. Review this git diff and identify issues.
-
-## Git Diff
-```diff
-{diff}
-```
-
-## Review Instructions
-1. Check for security vulnerabilities
-2. Check for bugs and logic errors
-3. Check for breaking changes
-4. Check for missing error handling
-5. Consider the impact of these changes
-
-Provide your review in this JSON format:
-{{
-    "risk_score": <0-100>,
-    "quality_score": <0-100>,
-    "issues": [
-        {{
-            "severity": "<critical|warning|suggestion>",
-            "category": "<security|performance|maintainability|bug|style>",
-            "file": "<filename>",
-            "line": <line_number or null>,
-            "message": "<description of issue>",
-            "suggestion": "<how to fix>"
-        }}
-    ],
-    "summary": "<1-2 sentence summary of the changes and their quality>",
-    "merge_recommendation": "<approve|request_changes|needs_discussion>"
-}}
+        prompt = _DIFF_REVIEW_PROMPT.substitute(diff=diff)
 
-Return ONLY valid JSON."""
+        llm_result = self._stream_review(prompt, None, on_issue)
 
-        llm = self._get_llm()
-        content = llm.complete(prompt, max_tokens=2048, temperature=0.2)
-
-        try:
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            llm_result = json.loads(content.strip())
-        except (json.JSONDecodeError, IndexError):
-            llm_result = {
-                "risk_score": 50,
-                "quality_score": 50,
-                "issues": [],
-                "summary": "Unable to parse review",
-                "merge_recommendation": "needs_discussion",
-            }
-
-        issues = [
-            ReviewIssue(
-                severity=i.get("severity", "suggestion"),
-                category=i.get("category", "maintainability"),
-                file=i.get("file", "unknown"),
-                line=i.get("line"),
-                message=i.get("message", ""),
-                suggestion=i.get("suggestion"),
-            )
-            for i in llm_result.get("issues", [])
-        ]
+        issues = [self._to_issue(i, None) for i in llm_result.get("issues", [])]
 
         return ReviewResult(
             risk_score=llm_result.get("risk_score", 50),
@@ -318,3 +663,25 @@ Return ONLY valid JSON."""
             merge_recommendation=llm_result.get("merge_recommendation", "needs_discussion"),
             static_metrics={"diff_lines": len(diff.split("\n"))},
         )
+
+
+# The CodeAnalyzer of a review_many worker process, set by _init_review_worker
+_worker_analyzer: CodeAnalyzer | None = None
+
+
+def _init_review_worker(root: Path) -> None:
+    """Process pool initializer: build the worker's one CodeAnalyzer."""
+    global _worker_analyzer
+    _worker_analyzer = CodeAnalyzer(root)
+
+
+def _read_and_analyze(
+    file_path: Path, analyzer: CodeAnalyzer | None = None
+) -> tuple[str, CodeMetrics]:
+    """Reviewed content and static metrics for one file (picklable for worker processes).
+
+    Without ``analyzer``, a worker's own analyzer is used, else a new one.
+    """
+    if analyzer is None:
+        analyzer = _worker_analyzer or CodeAnalyzer(file_path.parent)
+    return CodeReviewer._read_file_content(file_path), analyzer.analyze_file(file_path)
@@ -0,0 +1,117 @@
+"""
+Helpers for fitting git diffs into an LLM prompt budget.
+"""
+
+import functools
+import re
+
+# Files whose hunks carry little review or effort signal
+# (lockfiles, build output, minified assets, vendored dependencies)
+GENERATED_FILE_RE = re.compile(
+    r"(^|/)(package-lock\.json|yarn\.lock|pnpm-lock\.yaml|poetry\.lock|Cargo\.lock)$"
+    r"|\.lock$|\.min\.(js|css)$|(^|/)dist/|(^|/)node_modules/"
+)
+
+_FILE_HEADER_RE = re.compile(r"^diff --git a/(.+?) b/(.+)$", re.M)
+_FILE_HEADER_BYTES_RE = re.compile(rb"^diff --git ", re.M)
+
+
+@functools.cache
+def _encoding():
+    """The tiktoken encoding, loaded on first use; None if tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:  # tiktoken is optional
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else estimate ~4 chars/token."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Head of ``text`` that fits in ``max_tokens`` tokens (same counting as ``count_tokens``)."""
+    encoding = _encoding()
+    if encoding is None:
+        return text[: max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def split_diff(diff: str) -> list[tuple[str, str]]:
+    """Split a unified diff into (path, file_diff) pairs on 'diff --git' boundaries."""
+    headers = list(_FILE_HEADER_RE.finditer(diff))
+    chunks = []
+    for i, match in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(diff)
+        chunks.append((match.group(2), diff[match.start():end]))
+    return chunks
+
+
+def decode_diff(raw: bytes, max_bytes: int) -> str:
+    """Decode only the reviewable head of a byte-mode diff.
+
+    Generated and binary file diffs are skipped without decoding, and decoding
+    stops once ``max_bytes`` of file diffs have been kept.
+    """
+    starts = [m.start() for m in _FILE_HEADER_BYTES_RE.finditer(raw)]
+    if not starts:
+        return raw[:max_bytes].decode("utf-8", errors="replace")
+
+    parts = []
+    used = 0
+    for i, start in enumerate(starts):
+        if used >= max_bytes:
+            break
+        end = starts[i + 1] if i + 1 < len(starts) else len(raw)
+        chunk = raw[start:end]
+
+        header = chunk.partition(b"\n")[0]
+        path = header.rsplit(b" b/", 1)[-1].decode("utf-8", errors="replace")
+        if GENERATED_FILE_RE.search(path) or b"\nBinary files " in chunk:
+            continue
+
+        chunk = chunk[: max_bytes - used]
+        parts.append(chunk.decode("utf-8", errors="replace"))
+        used += len(chunk)
+
+    return "".join(parts)
+
+
+def truncate_diff(diff: str, max_tokens: int = 6000) -> str:
+    """Pack whole per-file diffs into a token budget.
+
+    Generated files and binary hunks are dropped first; remaining files are
+    added in order until the budget is reached.
+    """
+    chunks = split_diff(diff)
+    if not chunks:
+        return diff[: max_tokens * 4]
+
+    reviewable = [
+        file_diff
+        for path, file_diff in chunks
+        if not GENERATED_FILE_RE.search(path) and "\nBinary files " not in file_diff
+    ]
+
+    packed = []
+    used = 0
+    for file_diff in reviewable:
+        tokens = count_tokens(file_diff)
+        if used + tokens > max_tokens:
+            continue
+        packed.append(file_diff)
+        used += tokens
+
+    if not packed and reviewable:
+        # A single oversized file: keep its head rather than sending nothing
+        return truncate_tokens(reviewable[0], max_tokens)
+
+    return "".join(packed)
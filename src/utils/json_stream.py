@@ -0,0 +1,65 @@
+"""
+Incremental scanning of a JSON object streamed from an LLM.
+"""
+
+import orjson
+
+
+class JsonObjectStream:
+    """Collects streamed JSON text and returns nested objects as soon as they close.
+
+    Text before the root ``{`` (e.g. a ```json fence) is ignored. Objects opening
+    at ``object_depth`` (counting braces and brackets; 3 is an object inside a
+    list inside the root) are parsed and returned from ``feed`` on their closing
+    brace, before the rest of the response has arrived.
+    """
+
+    def __init__(self, object_depth: int = 3):
+        self.object_depth = object_depth
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start = None
+        self._done = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Append a chunk; return the objects at ``object_depth`` it completed."""
+        self.text += chunk
+        completed = []
+        text = self.text
+        for i in range(self._pos, len(text)):
+            if self._done:
+                break
+            char = text[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "{" and self._depth == self.object_depth:
+                    self._object_start = i
+            elif char in "}]":
+                closes_object = char == "}" and self._depth == self.object_depth
+                if closes_object and self._object_start is not None:
+                    try:
+                        completed.append(orjson.loads(text[self._object_start : i + 1]))
+                    except orjson.JSONDecodeError:
+                        pass
+                    self._object_start = None
+                self._depth -= 1
+                self._done = self._depth == 0
+
+        self._pos = len(text)
+        return completed
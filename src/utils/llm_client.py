@@ -3,7 +3,73 @@ Unified LLM client supporting Anthropic and OpenRouter.
 """
 
 import os
-from openai import OpenAI
+import re
+from typing import Iterator
+
+import orjson
+
+# A fenced ```json / ``` block in an LLM response
+_JSON_BLOCK_RE = re.compile(rb"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# A comma directly before a closing brace/bracket, which strict JSON rejects
+_TRAILING_COMMA_RE = re.compile(rb",(\s*[}\]])")
+
+# Connection pool for each SDK client; batch callers keep up to ~8 requests in flight
+HTTP_MAX_KEEPALIVE = 32
+HTTP_MAX_CONNECTIONS = 64
+
+# Request timeouts (seconds) and retries; the SDKs back off exponentially with jitter.
+# Reads get longer: a non-streaming 4096-token reply arrives only once fully generated
+LLM_TIMEOUT = 30.0
+LLM_READ_TIMEOUT = 120.0
+LLM_MAX_RETRIES = 3
+
+
+def parse_json_response(content: str) -> dict:
+    """Parse the JSON object from an LLM response, fenced or bare.
+
+    Near-valid output with trailing commas is accepted on a second attempt.
+    Raises ``json.JSONDecodeError`` (via ``orjson.JSONDecodeError``) if it is not valid JSON.
+    """
+    raw = content.encode()
+    match = _JSON_BLOCK_RE.search(raw)
+    payload = match.group(1) if match else raw.strip()
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        repaired = _TRAILING_COMMA_RE.sub(rb"\1", payload)
+        if repaired == payload:
+            raise
+        return orjson.loads(repaired)
+
+
+def _timeout():
+    """httpx timeout for SDK requests: short to connect, long enough to read a full reply."""
+    import httpx
+
+    return httpx.Timeout(LLM_TIMEOUT, read=LLM_READ_TIMEOUT)
+
+
+def _request_errors(sdk_error: type[Exception]) -> tuple[type[Exception], ...]:
+    """Errors a request raises once retries are exhausted.
+
+    The SDK's API errors (including timeouts), plus httpx transport errors
+    that can surface mid-stream.
+    """
+    import httpx
+
+    return (sdk_error, httpx.HTTPError)
+
+
+def _http_client(asynchronous: bool = False):
+    """Pooled HTTP/2 httpx client for an SDK, so requests reuse one TLS connection."""
+    import httpx
+
+    limits = httpx.Limits(
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE, max_connections=HTTP_MAX_CONNECTIONS
+    )
+    client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+    return client_cls(http2=True, limits=limits)
 
 
 def get_llm_client():
@@ -15,8 +81,6 @@ def get_llm_client():
     if openrouter_key:
         return OpenRouterClient(openrouter_key)
     elif anthropic_key:
-        # Use Anthropic via OpenRouter format for consistency
-        import anthropic
         return AnthropicClient(anthropic_key)
     else:
         raise ValueError("Set OPENROUTER_API_KEY or ANTHROPIC_API_KEY")
@@ -25,21 +89,116 @@ def get_llm_client():
 class OpenRouterClient:
     """OpenRouter LLM client."""
 
+    BASE_URL = "https://openrouter.ai/api/v1"
+
     def __init__(self, api_key: str):
+        from openai import APIError, OpenAI
+        self.api_key = api_key
+        self.request_errors = _request_errors(APIError)
         self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
+            base_url=self.BASE_URL,
             api_key=api_key,
+            http_client=_http_client(),
+            timeout=_timeout(),
+            max_retries=LLM_MAX_RETRIES,
         )
+        self.async_client = None  # Lazy load, only batch callers need it
         # Use Claude Sonnet via OpenRouter
         self.model = "anthropic/claude-sonnet-4"
 
-    def complete(self, prompt: str, max_tokens: int = 2048, temperature: float = 0.3) -> str:
-        """Generate completion."""
+    @staticmethod
+    def _messages(prompt: str, system: str | None) -> list[dict]:
+        """Chat messages; a ``system`` prefix is marked cacheable.
+
+        OpenRouter forwards the ``cache_control`` breakpoint to Anthropic models.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ],
+            })
+        return messages
+
+    @staticmethod
+    def _response_format(json_schema: dict | None) -> dict:
+        """Structured-output kwargs constraining the reply to ``json_schema``."""
+        if not json_schema:
+            return {}
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": json_schema.get("title", "response"),
+                    "strict": True,
+                    "schema": json_schema,
+                },
+            }
+        }
+
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+        json_schema: dict | None = None,
+    ) -> str:
+        """Generate completion; with ``json_schema`` the reply is JSON matching it."""
         response = self.client.chat.completions.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            messages=[{"role": "user", "content": prompt}],
+            messages=self._messages(prompt, system),
+            **self._response_format(json_schema),
+        )
+        return response.choices[0].message.content
+
+    def complete_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+    ) -> Iterator[str]:
+        """Generate completion, yielding text as it arrives."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=self._messages(prompt, system),
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def acomplete(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+        json_schema: dict | None = None,
+    ) -> str:
+        """Generate completion without blocking the event loop."""
+        if self.async_client is None:
+            from openai import AsyncOpenAI
+            self.async_client = AsyncOpenAI(
+                base_url=self.BASE_URL,
+                api_key=self.api_key,
+                http_client=_http_client(True),
+                timeout=_timeout(),
+                max_retries=LLM_MAX_RETRIES,
+            )
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=self._messages(prompt, system),
+            **self._response_format(json_schema),
         )
         return response.choices[0].message.content
 
@@ -49,15 +208,109 @@ class AnthropicClient:
 
     def __init__(self, api_key: str):
         import anthropic
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.api_key = api_key
+        self.request_errors = _request_errors(anthropic.APIError)
+        self.client = anthropic.Anthropic(
+            api_key=api_key,
+            http_client=_http_client(),
+            timeout=_timeout(),
+            max_retries=LLM_MAX_RETRIES,
+        )
+        self.async_client = None  # Lazy load, only batch callers need it
         self.model = "claude-sonnet-4-20250514"
 
-    def complete(self, prompt: str, max_tokens: int = 2048, temperature: float = 0.3) -> str:
-        """Generate completion."""
+    @staticmethod
+    def _system_kwargs(system: str | None) -> dict:
+        """``system`` as an ephemeral prompt-cache block.
+
+        Repeated calls with the same prefix then only pay for the user turn.
+        """
+        if not system:
+            return {}
+        return {
+            "system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        }
+
+    @staticmethod
+    def _tool_kwargs(json_schema: dict | None) -> dict:
+        """A single forced tool whose input is ``json_schema``, for structured replies."""
+        if not json_schema:
+            return {}
+        name = json_schema.get("title", "response")
+        return {
+            "tools": [
+                {"name": name, "description": "Record the result.", "input_schema": json_schema}
+            ],
+            "tool_choice": {"type": "tool", "name": name},
+        }
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """The reply text, or the forced tool call's input as a JSON string."""
+        for block in response.content:
+            if block.type == "tool_use":
+                return orjson.dumps(block.input).decode()
+        return response.content[0].text
+
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+        json_schema: dict | None = None,
+    ) -> str:
+        """Generate completion; with ``json_schema`` the reply is JSON matching it."""
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
             messages=[{"role": "user", "content": prompt}],
+            **self._system_kwargs(system),
+            **self._tool_kwargs(json_schema),
         )
-        return response.content[0].text
+        return self._response_text(response)
+
+    def complete_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+    ) -> Iterator[str]:
+        """Generate completion, yielding text as it arrives."""
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+            **self._system_kwargs(system),
+        ) as stream:
+            yield from stream.text_stream
+
+    async def acomplete(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        system: str | None = None,
+        json_schema: dict | None = None,
+    ) -> str:
+        """Generate completion without blocking the event loop."""
+        if self.async_client is None:
+            import anthropic
+            self.async_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=_http_client(True),
+                timeout=_timeout(),
+                max_retries=LLM_MAX_RETRIES,
+            )
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+            **self._system_kwargs(system),
+            **self._tool_kwargs(json_schema),
+        )
+        return self._response_text(response)
@@ -2,18 +2,21 @@
 Historical accuracy validation - compare estimates to actual commit times.
 """
 
-import json
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 
-from dotenv import load_dotenv
-load_dotenv()
+import numpy as np
+import orjson
 
 from src.analyzers.commit_analyzer import CommitAnalyzer, CommitData
 from src.estimator.task_estimator import TaskEstimator
 
+# Estimates are LLM-bound; cap in-flight requests to stay under provider rate limits
+MAX_CONCURRENT_ESTIMATES = 6
 
-@dataclass
+
+@dataclass(slots=True)
 class AccuracyResult:
     """Result of comparing estimate to actual."""
     commit_message: str
@@ -43,80 +46,115 @@ class AccuracyResult:
             "error": f"{self.error_hours:+.1f}h",
         }
 
+    def to_json(self) -> bytes:
+        """``to_dict`` serialized with orjson, as UTF-8 bytes ready to write."""
+        return orjson.dumps(self.to_dict())
+
+
+def _estimate_one(estimator: TaskEstimator, commit: CommitData) -> AccuracyResult | None:
+    """Estimate one commit's message as if it were a task and score it."""
+    try:
+        # Get estimate for this commit's message (as if it were a task); bypass the
+        # result cache so near-duplicate messages are still estimated independently
+        estimate = estimator.estimate_task(commit.message, use_cache=False)
+    except Exception:
+        return None
+
+    actual = commit.time_since_last_commit_hours
+    est_low = estimate.estimated_hours_low
+    est_high = estimate.estimated_hours_high
+
+    # Check if actual is within estimated range
+    within_range = est_low <= actual <= est_high
+
+    # Calculate error (midpoint vs actual)
+    est_mid = (est_low + est_high) / 2
+    error = actual - est_mid
+
+    return AccuracyResult(
+        commit_message=commit.message[:60],
+        category=commit.category,
+        actual_hours=actual,
+        actual_files=commit.files_changed,
+        actual_churn=commit.total_churn,
+        estimated_low=est_low,
+        estimated_high=est_high,
+        confidence=estimate.confidence,
+        within_range=within_range,
+        error_hours=error,
+    )
+
 
 def analyze_historical_accuracy(
     repo_path: Path,
     sample_size: int = 10,
     min_hours: float = 0.2,  # Skip instant commits (< 12 min)
     max_hours: float = 6.0,  # Skip overnight gaps
+    commits: list[CommitData] | None = None,  # Reuse an existing analysis
+    executor: Executor | None = None,  # Run estimates on a caller-owned pool
 ) -> list[AccuracyResult]:
     """
     Analyze historical accuracy by comparing estimates to actual commit times.
 
     Uses time between commits as a proxy for actual work time.
     Filters out outliers (too quick or overnight gaps).
+    Sampled commits are estimated concurrently; results keep sample order.
 
     Note: This is an approximation - works best for focused coding sessions.
     We cap at 6h to filter overnight gaps.
     """
 
-    # Get commit history
-    analyzer = CommitAnalyzer(repo_path)
-    commits = analyzer.analyze_commits()
+    from dotenv import load_dotenv
 
-    # Filter commits with reasonable time gaps (within a work session)
-    valid_commits = [
-        c for c in commits
-        if c.time_since_last_commit_hours is not None
-        and min_hours <= c.time_since_last_commit_hours <= max_hours
-        and c.total_churn > 3  # Skip trivial commits
-    ]
+    load_dotenv()  # API keys, when called outside the CLI/demo entry points
+
+    # Get commit history
+    if commits is None:
+        commits = CommitAnalyzer(repo_path).analyze_commits()
+
+    # Filter commits with reasonable time gaps (within a work session) on column arrays
+    hours = np.fromiter(
+        (
+            np.nan if c.time_since_last_commit_hours is None else c.time_since_last_commit_hours
+            for c in commits
+        ),
+        dtype=np.float64,
+        count=len(commits),
+    )
+    churn = np.fromiter((c.total_churn for c in commits), dtype=np.int64, count=len(commits))
+    valid = np.flatnonzero(
+        (hours >= min_hours) & (hours <= max_hours) & (churn > 3)  # Skip trivial commits
+    )
 
     # Sample commits for analysis
-    if len(valid_commits) > sample_size:
-        # Take evenly spaced samples
-        step = len(valid_commits) // sample_size
-        valid_commits = valid_commits[::step][:sample_size]
+    if len(valid) > sample_size:
+        # Evenly spaced samples spanning the first to the last commit
+        valid = valid[np.linspace(0, len(valid) - 1, sample_size, dtype=np.int64)]
+    valid_commits = [commits[i] for i in valid]
+
+    if not valid_commits:
+        return []
 
-    # Initialize estimator
+    # Initialize estimator; create the LLM client up front so threads share it
     estimator = TaskEstimator(
         chroma_path=str(Path(__file__).parent.parent.parent / "data" / "chroma")
     )
+    try:
+        estimator._get_llm()
+    except Exception:
+        return []
 
-    results = []
-
-    for commit in valid_commits:
-        # Get estimate for this commit's message (as if it were a task)
-        try:
-            estimate = estimator.estimate_task(commit.message)
-
-            actual = commit.time_since_last_commit_hours
-            est_low = estimate.estimated_hours_low
-            est_high = estimate.estimated_hours_high
+    def estimate(commit: CommitData) -> AccuracyResult | None:
+        return _estimate_one(estimator, commit)
 
-            # Check if actual is within estimated range
-            within_range = est_low <= actual <= est_high
+    if executor is not None:
+        results = list(executor.map(estimate, valid_commits))
+    else:
+        workers = min(len(valid_commits), MAX_CONCURRENT_ESTIMATES)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(estimate, valid_commits))
 
-            # Calculate error (midpoint vs actual)
-            est_mid = (est_low + est_high) / 2
-            error = actual - est_mid
-
-            results.append(AccuracyResult(
-                commit_message=commit.message[:60],
-                category=commit.category,
-                actual_hours=actual,
-                actual_files=commit.files_changed,
-                actual_churn=commit.total_churn,
-                estimated_low=est_low,
-                estimated_high=est_high,
-                confidence=estimate.confidence,
-                within_range=within_range,
-                error_hours=error,
-            ))
-        except Exception:
-            continue
-
-    return results
+    return [r for r in results if r is not None]
 
 
 def get_accuracy_summary(results: list[AccuracyResult]) -> dict:
@@ -124,17 +162,23 @@ def get_accuracy_summary(results: list[AccuracyResult]) -> dict:
     if not results:
         return {"error": "No results"}
 
-    within_range_count = sum(1 for r in results if r.within_range)
+    # One pass for every count and the error sum
+    within_range_count = underestimates = overestimates = 0
+    error_sum = 0.0
+    for r in results:
+        within_range_count += r.within_range
+        error_sum += r.error_hours
+        if r.error_hours > 0:
+            underestimates += 1
+        elif r.error_hours < 0:
+            overestimates += 1
     total = len(results)
 
-    errors = [r.error_hours for r in results]
-    avg_error = sum(errors) / len(errors)
-
     return {
         "total_samples": total,
         "within_range": within_range_count,
         "accuracy_pct": round(within_range_count / total * 100, 1),
-        "avg_error_hours": round(avg_error, 1),
-        "underestimates": sum(1 for e in errors if e > 0),
-        "overestimates": sum(1 for e in errors if e < 0),
+        "avg_error_hours": round(error_sum / total, 1),
+        "underestimates": underestimates,
+        "overestimates": overestimates,
     }
@@ -0,0 +1,24 @@
+"""
+Tests for the task estimator's embedding setup.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("onnxruntime.quantization")
+np = pytest.importorskip("numpy")
+
+from src.estimator.task_estimator import _QuantizedMiniLM  # noqa: E402
+
+
+def test_quantized_minilm_embeds_text():
+    embedder = _QuantizedMiniLM()
+
+    (embedding,) = embedder(["Add rate limiting to the login endpoint"])
+
+    assert len(embedding) == 384
+    assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-3)
+    model_dir = Path(embedder.DOWNLOAD_PATH) / embedder.EXTRACTED_FOLDER_NAME
+    assert (model_dir / "model.int8.onnx").exists()